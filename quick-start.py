@@ -2,6 +2,7 @@
 """Quick start example - Using the EVERSE Unified API locally."""
 
 import json
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 # Import scripts (adjust path as needed)
@@ -21,11 +22,15 @@ def main():
     print("EVERSE Unified API - Quick Start")
     print("=" * 60)
 
-    # Fetch data
+    # Fetch data (the three sources are independent, so fetch them concurrently)
     print("\n1. Fetching data...")
-    indicators = fetch_and_validate_indicators(use_cache=True)
-    tools = fetch_and_validate_tools(use_cache=True)
-    dimensions = fetch_and_validate_dimensions(use_cache=True)
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        indicators_future = executor.submit(fetch_and_validate_indicators, use_cache=True)
+        tools_future = executor.submit(fetch_and_validate_tools, use_cache=True)
+        dimensions_future = executor.submit(fetch_and_validate_dimensions, use_cache=True)
+        indicators = indicators_future.result()
+        tools = tools_future.result()
+        dimensions = dimensions_future.result()
 
     print(f"   ✓ {len(indicators)} indicators")
     print(f"   ✓ {len(tools)} tools")
@@ -39,7 +44,7 @@ def main():
     builder.add_dimensions(dimensions)
     builder.build_all_relationships()
 
-    print(f"   ✓ {len(builder.relationships)} relationships")
+    print(f"   ✓ {builder.edge_count} relationships")
 
     # Show examples
     print("\n3. Example queries:")
@@ -71,7 +76,7 @@ def main():
     print(f"   Total indicators: {len(indicators)}")
     print(f"   Total tools: {len(tools)}")
     print(f"   Total dimensions: {len(dimensions)}")
-    print(f"   Total relationships: {len(builder.relationships)}")
+    print(f"   Total relationships: {builder.edge_count}")
 
     # Validate
     valid, errors = builder.validate_relationships()
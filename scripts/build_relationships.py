@@ -1,204 +1,322 @@
 """Build relationships between EVERSE entities."""
 
 import logging
+import sys
+from collections import defaultdict
 from pathlib import Path
-from typing import Dict, List, Set, Tuple
+from typing import Any, Callable, Dict, Iterator, List, NamedTuple, Set, Tuple
 
-from scripts.models import Indicator, Tool, Dimension, RelationshipEdge
-from scripts.utils import save_json, load_json
+import orjson
+
+from scripts.models import Indicator, Tool, Dimension
+from scripts.utils import load_json
 from scripts.config import CACHE_DIR
 
 logger = logging.getLogger(__name__)
 
+_RELATIONSHIPS_CACHE = CACHE_DIR / "relationships.json"
+
+# Maps an edge's source/target type to the builder attribute holding that entity type
+_TYPE_TO_STORE = {"Indicator": "indicators", "Tool": "tools", "Dimension": "dimensions"}
+
+# Source and target entity types of each relationship type, in build order
+_RELATION_TYPES = {
+    "measures": ("Tool", "Indicator"),
+    "measured_by": ("Indicator", "Tool"),
+    "contains": ("Dimension", "Indicator"),
+    "part_of": ("Indicator", "Dimension"),
+}
+
+
+class Edge(NamedTuple):
+    """Lightweight relationship edge; same fields as the RelationshipEdge model."""
+
+    source_id: str
+    source_type: str
+    target_id: str
+    target_type: str
+    relationship_type: str
+
 
 class RelationshipBuilder:
     """Build and manage relationships between EVERSE entities."""
 
+    __slots__ = (
+        "indicators",
+        "tools",
+        "dimensions",
+        "_edges_by_rel",
+        "_built",
+        "_tools_by_indicator",
+        "_indicators_by_tool",
+        "_indicators_by_dimension",
+        "_indicator_dumps",
+        "_tool_dumps",
+        "_dimension_dumps",
+    )
+
     def __init__(self):
         """Initialize relationship builder."""
         self.indicators: Dict[str, Indicator] = {}
         self.tools: Dict[str, Tool] = {}
         self.dimensions: Dict[str, Dimension] = {}
-        self.relationships: List[RelationshipEdge] = []
+
+        # (source_id, target_id) pairs bucketed by relationship type; the entity
+        # types of each bucket are implied by _RELATION_TYPES
+        self._edges_by_rel: Dict[str, List[Tuple[str, str]]] = {rel_type: [] for rel_type in _RELATION_TYPES}
+        # Relationship types whose pass has run; passes run lazily on first use
+        self._built: Set[str] = set()
+
+        # Adjacency indexes, filled in as edges are created
+        self._tools_by_indicator: Dict[str, List[str]] = defaultdict(list)
+        self._indicators_by_tool: Dict[str, List[str]] = defaultdict(list)
+        self._indicators_by_dimension: Dict[str, List[str]] = defaultdict(list)
+
+        # JSON-mode dumps of each entity, computed once when it is added
+        self._indicator_dumps: Dict[str, Dict[str, Any]] = {}
+        self._tool_dumps: Dict[str, Dict[str, Any]] = {}
+        self._dimension_dumps: Dict[str, Dict[str, Any]] = {}
 
     def add_indicators(self, indicators: List[Indicator]) -> None:
         """Add indicators to the builder."""
+        # Intern ids so the copies held by edges and indexes share one string object
         for indicator in indicators:
-            self.indicators[indicator.id] = indicator
+            indicator_id = sys.intern(indicator.id)
+            self.indicators[indicator_id] = indicator
+            self._indicator_dumps[indicator_id] = indicator.model_dump(mode="json")
+        self._reset_relationships()
         logger.info(f"Added {len(indicators)} indicators")
 
     def add_tools(self, tools: List[Tool]) -> None:
         """Add tools to the builder."""
         for tool in tools:
-            self.tools[tool.id] = tool
+            tool_id = sys.intern(tool.id)
+            self.tools[tool_id] = tool
+            self._tool_dumps[tool_id] = tool.model_dump(mode="json")
+        self._reset_relationships()
         logger.info(f"Added {len(tools)} tools")
 
     def add_dimensions(self, dimensions: List[Dimension]) -> None:
         """Add dimensions to the builder."""
         for dimension in dimensions:
-            self.dimensions[dimension.id] = dimension
+            dimension_id = sys.intern(dimension.id)
+            self.dimensions[dimension_id] = dimension
+            self._dimension_dumps[dimension_id] = dimension.model_dump(mode="json")
+        self._reset_relationships()
         logger.info(f"Added {len(dimensions)} dimensions")
 
+    def _reset_relationships(self) -> None:
+        """Drop built edges and indexes so they are rebuilt against the current entities."""
+        self._edges_by_rel = {rel_type: [] for rel_type in _RELATION_TYPES}
+        self._built.clear()
+        self._tools_by_indicator = defaultdict(list)
+        self._indicators_by_tool = defaultdict(list)
+        self._indicators_by_dimension = defaultdict(list)
+
+    @property
+    def relationships(self) -> List[Edge]:
+        """Relationship edges built so far, materialized from the per-type buckets."""
+        return list(self._iter_edges())
+
+    def _iter_edges(self) -> Iterator[Edge]:
+        """Yield relationship edges one at a time."""
+        for rel_type, (source_type, target_type) in _RELATION_TYPES.items():
+            for source_id, target_id in self._edges_by_rel[rel_type]:
+                yield Edge(source_id, source_type, target_id, target_type, rel_type)
+
+    @property
+    def edge_count(self) -> int:
+        """Number of relationship edges built so far."""
+        return sum(map(len, self._edges_by_rel.values()))
+
+    def _add_edges(self, relationship_type: str, pairs: List[Tuple[str, str]]) -> None:
+        """Record (source_id, target_id) pairs of one relationship type and index them."""
+        self._edges_by_rel[relationship_type].extend(pairs)
+        self._built.add(relationship_type)
+
+        if relationship_type == "measures":
+            for tool_id, indicator_id in pairs:
+                self._tools_by_indicator[indicator_id].append(tool_id)
+                self._indicators_by_tool[tool_id].append(indicator_id)
+        elif relationship_type == "contains":
+            for dimension_id, indicator_id in pairs:
+                self._indicators_by_dimension[dimension_id].append(indicator_id)
+
+    def _ensure_relation(self, relationship_type: str) -> None:
+        """Run the build pass for a relationship type unless it has already run."""
+        if relationship_type not in self._built:
+            self._add_edges(relationship_type, self._collectors()[relationship_type]())
+
+    def _collectors(self) -> Dict[str, Callable[[], List[Tuple[str, str]]]]:
+        """Map each relationship type to the pass that collects its edges."""
+        return {
+            "measures": self._collect_tool_to_indicator_edges,
+            "measured_by": self._collect_indicator_to_tool_edges,
+            "contains": self._collect_dimension_to_indicator_edges,
+            "part_of": self._collect_indicator_to_dimension_edges,
+        }
+
     def build_tool_to_indicator_relationships(self) -> None:
         """Build relationships from tools to indicators."""
+        self._ensure_relation("measures")
+
+    def build_indicator_to_tool_relationships(self) -> None:
+        """Build reverse relationships from indicators to tools."""
+        self._ensure_relation("measured_by")
+
+    def build_dimension_to_indicator_relationships(self) -> None:
+        """Build relationships from dimensions to indicators."""
+        self._ensure_relation("contains")
+
+    def build_indicator_to_dimension_relationships(self) -> None:
+        """Build reverse relationships from indicators to dimensions."""
+        self._ensure_relation("part_of")
+
+    def _collect_tool_to_indicator_edges(self) -> List[Tuple[str, str]]:
+        """Collect tool → indicator edges without recording them."""
         logger.info("Building tool → indicator relationships...")
 
-        count = 0
+        edges: List[Tuple[str, str]] = []
+        indicators = self.indicators
         for tool_id, tool in self.tools.items():
             for indicator_id in tool.related_indicators:
-                if indicator_id in self.indicators:
-                    edge = RelationshipEdge(
-                        source_id=tool_id,
-                        source_type="Tool",
-                        target_id=indicator_id,
-                        target_type="Indicator",
-                        relationship_type="measures",
-                    )
-                    self.relationships.append(edge)
-                    count += 1
-                else:
+                if indicator_id not in indicators:
                     logger.warning(f"Tool {tool_id} references unknown indicator {indicator_id}")
+                    continue
 
-        logger.info(f"Created {count} tool → indicator relationships")
+                edges.append((tool_id, indicator_id))
 
-    def build_indicator_to_tool_relationships(self) -> None:
-        """Build reverse relationships from indicators to tools."""
+        logger.info(f"Created {len(edges)} tool → indicator relationships")
+        return edges
+
+    def _collect_indicator_to_tool_edges(self) -> List[Tuple[str, str]]:
+        """Collect indicator → tool edges without recording them."""
         logger.info("Building indicator → tool relationships...")
 
-        count = 0
+        edges: List[Tuple[str, str]] = []
+        tools = self.tools
         for indicator_id, indicator in self.indicators.items():
             for tool_id in indicator.related_tools:
-                if tool_id in self.tools:
-                    edge = RelationshipEdge(
-                        source_id=indicator_id,
-                        source_type="Indicator",
-                        target_id=tool_id,
-                        target_type="Tool",
-                        relationship_type="measured_by",
-                    )
-                    self.relationships.append(edge)
-                    count += 1
-                else:
+                if tool_id not in tools:
                     logger.warning(f"Indicator {indicator_id} references unknown tool {tool_id}")
+                    continue
 
-        logger.info(f"Created {count} indicator → tool relationships")
+                edges.append((indicator_id, tool_id))
 
-    def build_dimension_to_indicator_relationships(self) -> None:
-        """Build relationships from dimensions to indicators."""
+        logger.info(f"Created {len(edges)} indicator → tool relationships")
+        return edges
+
+    def _collect_dimension_to_indicator_edges(self) -> List[Tuple[str, str]]:
+        """Collect dimension → indicator edges without recording them."""
         logger.info("Building dimension → indicator relationships...")
 
-        count = 0
+        edges: List[Tuple[str, str]] = []
+        indicators = self.indicators
         for dimension_id, dimension in self.dimensions.items():
             for indicator_id in dimension.indicators:
-                if indicator_id in self.indicators:
-                    edge = RelationshipEdge(
-                        source_id=dimension_id,
-                        source_type="Dimension",
-                        target_id=indicator_id,
-                        target_type="Indicator",
-                        relationship_type="contains",
-                    )
-                    self.relationships.append(edge)
-                    count += 1
-                else:
+                if indicator_id not in indicators:
                     logger.warning(f"Dimension {dimension_id} references unknown indicator {indicator_id}")
+                    continue
 
-        logger.info(f"Created {count} dimension → indicator relationships")
+                edges.append((dimension_id, indicator_id))
 
-    def build_indicator_to_dimension_relationships(self) -> None:
-        """Build reverse relationships from indicators to dimensions."""
+        logger.info(f"Created {len(edges)} dimension → indicator relationships")
+        return edges
+
+    def _collect_indicator_to_dimension_edges(self) -> List[Tuple[str, str]]:
+        """Collect indicator → dimension edges without recording them."""
         logger.info("Building indicator → dimension relationships...")
 
-        count = 0
-        for indicator in self.indicators.values():
-            if indicator.dimension:
-                if indicator.dimension in self.dimensions:
-                    edge = RelationshipEdge(
-                        source_id=indicator.id,
-                        source_type="Indicator",
-                        target_id=indicator.dimension,
-                        target_type="Dimension",
-                        relationship_type="part_of",
-                    )
-                    self.relationships.append(edge)
-                    count += 1
-                else:
-                    logger.warning(f"Indicator {indicator.id} references unknown dimension {indicator.dimension}")
-
-        logger.info(f"Created {count} indicator → dimension relationships")
+        edges: List[Tuple[str, str]] = []
+        dimensions = self.dimensions
+        for indicator_id, indicator in self.indicators.items():
+            if not indicator.dimension:
+                continue
+
+            dimension_id = sys.intern(indicator.dimension)
+            if dimension_id not in dimensions:
+                logger.warning(f"Indicator {indicator_id} references unknown dimension {dimension_id}")
+                continue
+
+            edges.append((indicator_id, dimension_id))
+
+        logger.info(f"Created {len(edges)} indicator → dimension relationships")
+        return edges
 
     def build_all_relationships(self) -> None:
-        """Build all relationships."""
+        """
+        Build all relationships.
+
+        Only needed for full serialization: the get_* queries build the
+        relationship type they need on first use.
+        """
+        collectors = {
+            rel_type: collect for rel_type, collect in self._collectors().items() if rel_type not in self._built
+        }
+        if not collectors:
+            return
+
         logger.info("Building all relationships...")
-        self.build_tool_to_indicator_relationships()
-        self.build_indicator_to_tool_relationships()
-        self.build_dimension_to_indicator_relationships()
-        self.build_indicator_to_dimension_relationships()
-        logger.info(f"Total relationships built: {len(self.relationships)}")
+
+        for rel_type, collect in collectors.items():
+            self._add_edges(rel_type, collect())
+        logger.info(f"Total relationships built: {self.edge_count}")
 
     def get_tools_for_indicator(self, indicator_id: str) -> List[Tool]:
         """Get all tools that measure a specific indicator."""
-        tool_ids = set()
-        for rel in self.relationships:
-            if rel.target_id == indicator_id and rel.relationship_type == "measures":
-                tool_ids.add(rel.source_id)
-
-        return [self.tools[tool_id] for tool_id in tool_ids if tool_id in self.tools]
+        self._ensure_relation("measures")
+        return [self.tools[tool_id] for tool_id in self._tools_by_indicator.get(indicator_id, ())]
 
     def get_indicators_for_tool(self, tool_id: str) -> List[Indicator]:
         """Get all indicators measured by a specific tool."""
-        indicator_ids = set()
-        for rel in self.relationships:
-            if rel.source_id == tool_id and rel.relationship_type == "measures":
-                indicator_ids.add(rel.target_id)
-
-        return [self.indicators[ind_id] for ind_id in indicator_ids if ind_id in self.indicators]
+        self._ensure_relation("measures")
+        return [self.indicators[ind_id] for ind_id in self._indicators_by_tool.get(tool_id, ())]
 
     def get_indicators_for_dimension(self, dimension_id: str) -> List[Indicator]:
         """Get all indicators in a specific dimension."""
-        indicator_ids = set()
-        for rel in self.relationships:
-            if rel.source_id == dimension_id and rel.relationship_type == "contains":
-                indicator_ids.add(rel.target_id)
-
-        return [self.indicators[ind_id] for ind_id in indicator_ids if ind_id in self.indicators]
+        self._ensure_relation("contains")
+        return [self.indicators[ind_id] for ind_id in self._indicators_by_dimension.get(dimension_id, ())]
 
     def validate_relationships(self) -> Tuple[int, List[str]]:
         """
         Validate relationship integrity.
 
+        Each unknown entity id is reported once, however many edges reference it.
+
         Returns:
             Tuple of (valid_count, error_list)
         """
+        self.build_all_relationships()
         logger.info("Validating relationships...")
 
         valid_count = 0
         errors = []
 
-        for rel in self.relationships:
-            # Check source exists
-            if rel.source_type == "Indicator" and rel.source_id not in self.indicators:
-                errors.append(f"Relationship references unknown indicator {rel.source_id}")
-                continue
-            if rel.source_type == "Tool" and rel.source_id not in self.tools:
-                errors.append(f"Relationship references unknown tool {rel.source_id}")
-                continue
-            if rel.source_type == "Dimension" and rel.source_id not in self.dimensions:
-                errors.append(f"Relationship references unknown dimension {rel.source_id}")
-                continue
+        stores = {entity_type: getattr(self, attr) for entity_type, attr in _TYPE_TO_STORE.items()}
 
-            # Check target exists
-            if rel.target_type == "Indicator" and rel.target_id not in self.indicators:
-                errors.append(f"Relationship references unknown indicator {rel.target_id}")
-                continue
-            if rel.target_type == "Tool" and rel.target_id not in self.tools:
-                errors.append(f"Relationship references unknown tool {rel.target_id}")
-                continue
-            if rel.target_type == "Dimension" and rel.target_id not in self.dimensions:
-                errors.append(f"Relationship references unknown dimension {rel.target_id}")
+        for rel_type, (source_type, target_type) in _RELATION_TYPES.items():
+            pairs = self._edges_by_rel[rel_type]
+            if not pairs:
                 continue
 
-            valid_count += 1
+            # Check all endpoints of this relationship type at once
+            source_ids, target_ids = zip(*pairs)
+            missing_sources = set(source_ids) - stores[source_type].keys()
+            missing_targets = set(target_ids) - stores[target_type].keys()
+
+            for source_id in sorted(missing_sources):
+                errors.append(f"Relationship references unknown {source_type.lower()} {source_id}")
+            for target_id in sorted(missing_targets):
+                errors.append(f"Relationship references unknown {target_type.lower()} {target_id}")
+
+            if missing_sources or missing_targets:
+                valid_count += sum(
+                    1
+                    for source_id, target_id in pairs
+                    if source_id not in missing_sources and target_id not in missing_targets
+                )
+            else:
+                valid_count += len(pairs)
 
         logger.info(f"Validated {valid_count} relationships")
         if errors:
@@ -213,22 +331,30 @@ class RelationshipBuilder:
         Returns:
             Path to the cache file
         """
-        from pathlib import Path
+        self.build_all_relationships()
+        cache_file = _RELATIONSHIPS_CACHE
 
-        cache_file = Path(CACHE_DIR) / "relationships.json"
-
-        data = {
-            "type": "RelationshipGraph",
-            "edges": [rel.model_dump() for rel in self.relationships],
-            "node_counts": {
-                "indicators": len(self.indicators),
-                "tools": len(self.tools),
-                "dimensions": len(self.dimensions),
-            },
-            "edge_count": len(self.relationships),
+        node_counts = {
+            "indicators": len(self.indicators),
+            "tools": len(self.tools),
+            "dimensions": len(self.dimensions),
         }
 
-        save_json(data, cache_file)
+        # Stream edges one at a time rather than building the whole document in memory
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        with open(cache_file, "wb") as f:
+            f.write(b'{"type":"RelationshipGraph","edges":[')
+            for index, edge in enumerate(self._iter_edges()):
+                if index:
+                    f.write(b",")
+                f.write(orjson.dumps(edge._asdict()))
+            f.write(b'],"node_counts":')
+            f.write(orjson.dumps(node_counts))
+            f.write(b',"edge_count":')
+            f.write(orjson.dumps(self.edge_count))
+            f.write(b"}")
+
+        logger.info(f"Saved JSON to {cache_file}")
         return cache_file
 
     def export_graph(self) -> Dict:
@@ -238,18 +364,19 @@ class RelationshipBuilder:
         Returns:
             Graph data structure
         """
+        self.build_all_relationships()
         return {
             "type": "RelationshipGraph",
             "nodes": {
-                "indicators": {id: ind.model_dump(mode="json") for id, ind in self.indicators.items()},
-                "tools": {id: tool.model_dump(mode="json") for id, tool in self.tools.items()},
-                "dimensions": {id: dim.model_dump(mode="json") for id, dim in self.dimensions.items()},
+                "indicators": dict(self._indicator_dumps),
+                "tools": dict(self._tool_dumps),
+                "dimensions": dict(self._dimension_dumps),
             },
-            "edges": [rel.model_dump(mode="json") for rel in self.relationships],
+            "edges": [rel._asdict() for rel in self._iter_edges()],
             "statistics": {
                 "total_indicators": len(self.indicators),
                 "total_tools": len(self.tools),
                 "total_dimensions": len(self.dimensions),
-                "total_relationships": len(self.relationships),
+                "total_relationships": self.edge_count,
             },
         }
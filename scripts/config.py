@@ -33,25 +33,40 @@ DATA_DIR = os.path.join(BASE_DIR, "data")
 API_DIR = Path(os.path.join(BASE_DIR, "api", "v1"))
 CACHE_DIR = Path(os.path.join(BASE_DIR, ".cache"))
 
-# Ensure directories exist
+# Ensure directories exist (skip the mkdir syscall when they already do)
 for directory in [DATA_DIR, API_DIR, CACHE_DIR]:
-    os.makedirs(directory, exist_ok=True)
-
-# Create directories if they don't exist
-for directory in [DATA_DIR, API_DIR, CACHE_DIR]:
-    os.makedirs(directory, exist_ok=True)
+    if not os.path.isdir(directory):
+        os.makedirs(directory, exist_ok=True)
 
 # API Configuration
 API_VERSION = "v1"
 API_BASE_URL = os.getenv("API_BASE_URL", "https://vuillaut.github.io/evapi")
 API_CONTEXT = "https://w3id.org/everse/api/v1/context.jsonld"
 
+# Generated API files are written compactly for clients; set EVAPI_PRETTY=1 to indent them
+PRETTY_JSON = os.getenv("EVAPI_PRETTY") == "1"
+
+# Set EVAPI_GZIP=1 to write a pre-compressed .json.gz next to every generated JSON file
+GZIP_JSON = os.getenv("EVAPI_GZIP") == "1"
+
 # GitHub configuration
 GITHUB_TOKEN = os.getenv("GITHUB_TOKEN")
 
+# Branch every source file is read from, whichever GitHub API serves it
+GITHUB_BRANCH = "main"
+
 # Timeout for HTTP requests (seconds)
 HTTP_TIMEOUT = 30
 
+# Raw files are fetched concurrently; round-trip latency dominates each request
+FETCH_WORKERS = 16
+
+# Indicators, tools and dimensions are fetched at the same time
+CONCURRENT_SOURCES = 3
+
+# Connections kept per host by the shared HTTP session, one for every fetch worker of every source
+HTTP_POOL_SIZE = CONCURRENT_SOURCES * FETCH_WORKERS
+
 # Retry configuration
 MAX_RETRIES = 3
 RETRY_BACKOFF = 2  # Exponential backoff multiplier
@@ -1,53 +1,425 @@
 """API endpoint generator - creates static JSON files for the API."""
 
-import json
+import copy
+import hashlib
 import logging
-from datetime import datetime
+import os
+import tarfile
+import time
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from io import BytesIO
 from pathlib import Path
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional, Set, Tuple
+
+import orjson
 
 from models import Indicator, Tool, Dimension
-from config import API_DIR, API_VERSION, API_CONTEXT, API_BASE_URL
+from config import API_DIR, API_VERSION, API_CONTEXT, API_BASE_URL, CACHE_DIR
 
 logger = logging.getLogger(__name__)
 
 
+def _default_hashes_file(api_dir: Path) -> Path:
+    """
+    Where content hashes for api_dir are kept unless the caller chooses.
+
+    Kept apart from generate_api's sidecar because the two hash different encodings,
+    and keyed on the resolved api_dir so two output trees never share hashes.
+    """
+    digest = hashlib.blake2b(str(api_dir.resolve()).encode(), digest_size=8).hexdigest()
+    return CACHE_DIR / f"endpoint_generator_hashes_{digest}.json"
+
+
+# Entity files are small and independent; overlap their writes on a thread pool
+_WRITE_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+
+# Static OpenAPI document; version and server URL are patched in per generator
+_OPENAPI_SPEC_TEMPLATE: Dict[str, Any] = {
+    "openapi": "3.0.0",
+    "info": {
+        "title": "EVERSE Unified API",
+        "description": "Unified API for EVERSE research software quality services",
+        "version": API_VERSION,
+        "contact": {
+            "name": "EVERSE Technical Team",
+            "url": "https://everse.software/",
+        },
+        "license": {
+            "name": "Apache 2.0",
+            "url": "https://www.apache.org/licenses/LICENSE-2.0",
+        },
+    },
+    "servers": [
+        {
+            "url": API_BASE_URL,
+            "description": "Production API",
+        }
+    ],
+    "paths": {
+        "/": {
+            "get": {
+                "summary": "API Root",
+                "description": "Get available endpoints",
+                "responses": {
+                    "200": {
+                        "description": "API root information",
+                    }
+                },
+            }
+        },
+        "/indicators/": {
+            "get": {
+                "summary": "List Indicators",
+                "description": "Get all quality indicators",
+                "parameters": [
+                    {
+                        "name": "dimension",
+                        "in": "query",
+                        "description": "Filter by dimension",
+                        "schema": {"type": "string"},
+                    }
+                ],
+                "responses": {
+                    "200": {
+                        "description": "List of indicators",
+                    }
+                },
+            }
+        },
+        "/indicators/{id}": {
+            "get": {
+                "summary": "Get Indicator",
+                "description": "Get specific indicator details",
+                "parameters": [
+                    {
+                        "name": "id",
+                        "in": "path",
+                        "required": True,
+                        "description": "Indicator ID",
+                        "schema": {"type": "string"},
+                    }
+                ],
+                "responses": {
+                    "200": {
+                        "description": "Indicator details",
+                    },
+                    "404": {
+                        "description": "Indicator not found",
+                    },
+                },
+            }
+        },
+        "/tools/": {
+            "get": {
+                "summary": "List Tools",
+                "description": "Get all quality assessment tools",
+                "parameters": [
+                    {
+                        "name": "ring",
+                        "in": "query",
+                        "description": "Filter by ring (adopt, trial, assess, hold)",
+                        "schema": {"type": "string", "enum": ["adopt", "trial", "assess", "hold"]},
+                    },
+                    {
+                        "name": "quadrant",
+                        "in": "query",
+                        "description": "Filter by quadrant",
+                        "schema": {"type": "string"},
+                    },
+                ],
+                "responses": {
+                    "200": {
+                        "description": "List of tools",
+                    }
+                },
+            }
+        },
+        "/tools/{id}": {
+            "get": {
+                "summary": "Get Tool",
+                "description": "Get specific tool details",
+                "parameters": [
+                    {
+                        "name": "id",
+                        "in": "path",
+                        "required": True,
+                        "description": "Tool ID",
+                        "schema": {"type": "string"},
+                    }
+                ],
+                "responses": {
+                    "200": {
+                        "description": "Tool details",
+                    },
+                    "404": {
+                        "description": "Tool not found",
+                    },
+                },
+            }
+        },
+        "/tools/by-indicator/{indicator_id}": {
+            "get": {
+                "summary": "Get Tools for Indicator",
+                "description": "Get all tools that measure a specific indicator",
+                "parameters": [
+                    {
+                        "name": "indicator_id",
+                        "in": "path",
+                        "required": True,
+                        "description": "Indicator ID",
+                        "schema": {"type": "string"},
+                    }
+                ],
+                "responses": {
+                    "200": {
+                        "description": "List of tools for the indicator",
+                    }
+                },
+            }
+        },
+        "/dimensions/": {
+            "get": {
+                "summary": "List Dimensions",
+                "description": "Get all quality dimensions",
+                "responses": {
+                    "200": {
+                        "description": "List of dimensions",
+                    }
+                },
+            }
+        },
+        "/dimensions/{id}": {
+            "get": {
+                "summary": "Get Dimension",
+                "description": "Get specific dimension details",
+                "parameters": [
+                    {
+                        "name": "id",
+                        "in": "path",
+                        "required": True,
+                        "description": "Dimension ID",
+                        "schema": {"type": "string"},
+                    }
+                ],
+                "responses": {
+                    "200": {
+                        "description": "Dimension details",
+                    },
+                    "404": {
+                        "description": "Dimension not found",
+                    },
+                },
+            }
+        },
+        "/relationships/graph": {
+            "get": {
+                "summary": "Get Relationship Graph",
+                "description": "Get knowledge graph of all relationships",
+                "parameters": [
+                    {
+                        "name": "format",
+                        "in": "query",
+                        "description": "Output format",
+                        "schema": {"type": "string", "enum": ["json", "graphviz"]},
+                    },
+                    {
+                        "name": "depth",
+                        "in": "query",
+                        "description": "Relationship depth",
+                        "schema": {"type": "integer", "default": 2},
+                    },
+                ],
+                "responses": {
+                    "200": {
+                        "description": "Relationship graph",
+                    }
+                },
+            }
+        },
+    },
+    "components": {
+        "schemas": {
+            "Indicator": {
+                "type": "object",
+                "properties": {
+                    "id": {"type": "string"},
+                    "name": {"type": "string"},
+                    "description": {"type": "string"},
+                    "dimension": {"type": "string"},
+                    "category": {"type": "string"},
+                    "related_tools": {"type": "array", "items": {"type": "string"}},
+                },
+            },
+            "Tool": {
+                "type": "object",
+                "properties": {
+                    "id": {"type": "string"},
+                    "name": {"type": "string"},
+                    "description": {"type": "string"},
+                    "url": {"type": "string", "format": "uri"},
+                    "ring": {"type": "string", "enum": ["adopt", "trial", "assess", "hold"]},
+                    "related_indicators": {"type": "array", "items": {"type": "string"}},
+                },
+            },
+            "Dimension": {
+                "type": "object",
+                "properties": {
+                    "id": {"type": "string"},
+                    "name": {"type": "string"},
+                    "description": {"type": "string"},
+                    "indicators": {"type": "array", "items": {"type": "string"}},
+                },
+            },
+        }
+    },
+}
+
+
+@dataclass(slots=True)
+class IndicatorSummary:
+    """Indicator entry in the indicators collection; orjson serializes it directly."""
+
+    id: str
+    name: str
+    description: Optional[str]
+    dimension: Optional[str]
+    url: str
+
+
+@dataclass(slots=True)
+class ToolSummary:
+    """Tool entry in the tools collection; orjson serializes it directly."""
+
+    id: str
+    name: str
+    description: Optional[str]
+    ring: Optional[str]
+    url: str
+
+
+def _entity_dict(prelude: Dict[str, Any], *fields: Tuple[str, Any]) -> Dict[str, Any]:
+    """Build an entity response from a prelude and (key, value) pairs, skipping None values."""
+    data = prelude.copy()
+    data.update((key, value) for key, value in fields if value is not None)
+    return data
+
+
 class APIGenerator:
     """Generate static API endpoints as JSON files."""
 
-    def __init__(self, api_dir: Path = API_DIR):
-        """Initialize the generator."""
+    def __init__(self, api_dir: Path = API_DIR, archive_mode: bool = False, hashes_file: Optional[Path] = None):
+        """
+        Initialize the generator.
+
+        Args:
+            api_dir: Output directory for the API files
+            archive_mode: Write every endpoint into a single <api_dir>.tar next to
+                api_dir instead of individual files, so the archive is not
+                published with the served tree
+            hashes_file: Where content hashes are kept between runs; defaults to a
+                file under CACHE_DIR named after api_dir
+
+        Use the generator as a context manager, or call close() once generation is
+        finished; that completes the archive and records content hashes so unchanged
+        files are not rewritten next run.
+        """
         self.api_dir = api_dir
         self.api_version = API_VERSION
         self.api_context = API_CONTEXT
         self.base_url = API_BASE_URL
+        self._root_url = f"{self.base_url}/"
+        self._known_dirs: Set[Path] = set()
+        self._indicator_prelude = {"@context": self.api_context, "@type": "Indicator"}
+        self._tool_prelude = {"@context": self.api_context, "@type": "Tool"}
+        self._dimension_prelude = {"@context": self.api_context, "@type": "Dimension"}
+        self._hashes_file = hashes_file or _default_hashes_file(api_dir)
+        self._hashes: Dict[str, str] = {}
+        if self._hashes_file.exists():
+            self._hashes = orjson.loads(self._hashes_file.read_bytes())
+        self._archive: Optional[tarfile.TarFile] = None
+        if archive_mode:
+            api_dir.parent.mkdir(parents=True, exist_ok=True)
+            self._archive = tarfile.open(api_dir.with_name(f"{api_dir.name}.tar"), "w")
+        self.refresh_timestamp()
+
+    def __enter__(self) -> "APIGenerator":
+        """Return the generator for use in a with block."""
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        """Close the generator when the with block exits."""
+        self.close()
+
+    def close(self) -> None:
+        """Finish writing the archive and save the content hashes of written files."""
+        if self._archive is not None:
+            self._archive.close()
+            self._archive = None
+        if self._hashes:
+            self._hashes_file.parent.mkdir(parents=True, exist_ok=True)
+            self._hashes_file.write_bytes(orjson.dumps(self._hashes, option=orjson.OPT_SORT_KEYS))
+
+    def refresh_timestamp(self) -> None:
+        """Reset the generation timestamp stamped on every endpoint file."""
+        self._generated_ts = time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime())
 
     def _save_json(self, data: Dict[str, Any], filepath: Path) -> None:
-        """Save data as JSON file."""
-        filepath.parent.mkdir(parents=True, exist_ok=True)
-        with open(filepath, "w", encoding="utf-8") as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
-
-    def _add_hateoas_links(self, data: Dict[str, Any], entity_id: str = None, entity_type: str = None) -> Dict[str, Any]:
-        """Add HATEOAS links to response."""
-        if "links" not in data:
-            data["links"] = {}
-
-        # Self link
-        if entity_type and entity_id:
-            data["links"]["self"] = f"{self.base_url}/{entity_type}/{entity_id}"
-        elif entity_type:
-            data["links"]["self"] = f"{self.base_url}/{entity_type}/"
-
-        # Root link
-        data["links"]["root"] = f"{self.base_url}/"
+        """Save data as JSON file, skipping files whose content is unchanged since the last run."""
+        relpath = filepath.relative_to(self.api_dir).as_posix()
+
+        if self._archive is None:
+            # Hash without the per-run timestamp so unchanged endpoints keep their previous file
+            content = orjson.dumps({k: v for k, v in data.items() if k != "generated"}, default=str)
+            content_hash = hashlib.blake2b(content, digest_size=16).hexdigest()
+            if self._hashes.get(relpath) == content_hash and filepath.exists():
+                return
+            self._hashes[relpath] = content_hash
+
+        # default=str covers pydantic HttpUrl values, which orjson cannot serialize natively
+        payload = orjson.dumps(data, default=str, option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE)
+
+        if self._archive is not None:
+            info = tarfile.TarInfo(relpath)
+            info.size = len(payload)
+            # A fixed mtime keeps the archive identical across runs when no member changed
+            info.mtime = 0
+            self._archive.addfile(info, BytesIO(payload))
+            return
+
+        # Output paths are deterministic within a run, so each directory only needs creating once
+        if filepath.parent not in self._known_dirs:
+            filepath.parent.mkdir(parents=True, exist_ok=True)
+            self._known_dirs.add(filepath.parent)
+        filepath.write_bytes(payload)
+
+    def _save_json_files(self, files: List[Tuple[Dict[str, Any], Path]]) -> None:
+        """Save (data, filepath) pairs concurrently."""
+        if self._archive is not None:
+            # Archive members are appended to a single stream, so write them in order
+            for data, filepath in files:
+                self._save_json(data, filepath)
+            return
+
+        with ThreadPoolExecutor(max_workers=_WRITE_WORKERS) as executor:
+            # Consume the results so that any write error is raised here
+            list(executor.map(lambda item: self._save_json(*item), files))
+
+    def _add_collection_links(self, data: Dict[str, Any], collection_url: str) -> Dict[str, Any]:
+        """Add HATEOAS links to a collection response."""
+        data["links"] = {"self": collection_url, "root": self._root_url}
+        return data
 
+    def _add_item_links(self, data: Dict[str, Any], item_prefix: str, entity_id: str) -> Dict[str, Any]:
+        """Add HATEOAS links to an entity response."""
+        data["links"] = {"self": item_prefix + entity_id, "root": self._root_url}
         return data
 
     def _add_timestamps(self, data: Dict[str, Any]) -> Dict[str, Any]:
         """Add timestamp information."""
         if "timestamp" not in data:
-            data["generated"] = datetime.utcnow().isoformat() + "Z"
+            data["generated"] = self._generated_ts
         return data
 
     def generate_root_endpoint(self) -> None:
@@ -78,6 +450,7 @@ class APIGenerator:
     def generate_indicators(self, indicators: List[Indicator]) -> None:
         """Generate indicators collection and individual endpoints."""
         logger.info(f"Generating {len(indicators)} indicator endpoints...")
+        indicators_url = f"{self.base_url}/indicators/"
 
         # Generate collection
         collection_data = {
@@ -87,57 +460,49 @@ class APIGenerator:
             "description": "Collection of all quality indicators",
             "totalItems": len(indicators),
             "items": [
-                {
-                    "id": ind.id,
-                    "name": ind.name,
-                    "description": ind.description,
-                    "dimension": ind.dimension,
-                    "url": f"{self.base_url}/indicators/{ind.id}",
-                }
+                IndicatorSummary(ind.id, ind.name, ind.description, ind.dimension, indicators_url + ind.id)
                 for ind in indicators
             ],
         }
-        collection_data = self._add_hateoas_links(collection_data, entity_type="indicators")
+        collection_data = self._add_collection_links(collection_data, indicators_url)
         collection_data = self._add_timestamps(collection_data)
 
-        output_file = self.api_dir / "indicators" / "index.json"
+        indicators_dir = self.api_dir / "indicators"
+        output_file = indicators_dir / "index.json"
         self._save_json(collection_data, output_file)
         logger.info(f"✓ Generated indicators collection: {output_file}")
 
         # Generate individual indicator files
+        entity_files = []
         for indicator in indicators:
-            indicator_data = {
-                "@context": self.api_context,
-                "@type": "Indicator",
-                "id": indicator.id,
-                "name": indicator.name,
-                "description": indicator.description,
-                "dimension": indicator.dimension,
-                "category": indicator.category,
-                "rationale": indicator.rationale,
-                "url": indicator.url,
-                "related_tools": indicator.related_tools,
-            }
-            # Remove None values
-            indicator_data = {k: v for k, v in indicator_data.items() if v is not None}
-            indicator_data = self._add_hateoas_links(indicator_data, indicator.id, "indicators")
-            indicator_data = self._add_timestamps(indicator_data)
-
-            output_file = self.api_dir / "indicators" / f"{indicator.id}.json"
-            self._save_json(indicator_data, output_file)
-
+            indicator_data = _entity_dict(
+                self._indicator_prelude,
+                ("id", indicator.id),
+                ("name", indicator.name),
+                ("description", indicator.description),
+                ("dimension", indicator.dimension),
+                ("category", indicator.category),
+                ("rationale", indicator.rationale),
+                ("url", indicator.url),
+                ("related_tools", indicator.related_tools),
+            )
+            self._add_item_links(indicator_data, indicators_url, indicator.id)
+            indicator_data["generated"] = self._generated_ts
+
+            entity_files.append((indicator_data, indicators_dir / f"{indicator.id}.json"))
+
+        self._save_json_files(entity_files)
         logger.info(f"✓ Generated {len(indicators)} individual indicator files")
 
     def generate_indicators_by_dimension(self, indicators: List[Indicator]) -> None:
         """Generate indicators grouped by dimension."""
         logger.info("Generating indicators by dimension...")
+        indicators_url = f"{self.base_url}/indicators/"
 
         # Group indicators by dimension
-        by_dimension: Dict[str, List[Indicator]] = {}
+        by_dimension: Dict[str, List[Indicator]] = defaultdict(list)
         for indicator in indicators:
             if indicator.dimension:
-                if indicator.dimension not in by_dimension:
-                    by_dimension[indicator.dimension] = []
                 by_dimension[indicator.dimension].append(indicator)
 
         # Create directory
@@ -154,7 +519,7 @@ class APIGenerator:
                     {
                         "id": ind.id,
                         "name": ind.name,
-                        "url": f"{self.base_url}/indicators/{ind.id}",
+                        "url": indicators_url + ind.id,
                     }
                     for ind in inds
                 ],
@@ -169,6 +534,7 @@ class APIGenerator:
     def generate_tools(self, tools: List[Tool]) -> None:
         """Generate tools collection and individual endpoints."""
         logger.info(f"Generating {len(tools)} tool endpoints...")
+        tools_url = f"{self.base_url}/tools/"
 
         # Generate collection
         collection_data = {
@@ -178,56 +544,47 @@ class APIGenerator:
             "description": "Collection of all quality assessment tools",
             "totalItems": len(tools),
             "items": [
-                {
-                    "id": tool.id,
-                    "name": tool.name,
-                    "description": tool.description,
-                    "ring": tool.ring,
-                    "url": f"{self.base_url}/tools/{tool.id}",
-                }
-                for tool in tools
+                ToolSummary(tool.id, tool.name, tool.description, tool.ring, tools_url + tool.id) for tool in tools
             ],
         }
-        collection_data = self._add_hateoas_links(collection_data, entity_type="tools")
+        collection_data = self._add_collection_links(collection_data, tools_url)
         collection_data = self._add_timestamps(collection_data)
 
-        output_file = self.api_dir / "tools" / "index.json"
+        tools_dir = self.api_dir / "tools"
+        output_file = tools_dir / "index.json"
         self._save_json(collection_data, output_file)
         logger.info(f"✓ Generated tools collection: {output_file}")
 
         # Generate individual tool files
+        entity_files = []
         for tool in tools:
-            tool_data = {
-                "@context": self.api_context,
-                "@type": "Tool",
-                "id": tool.id,
-                "name": tool.name,
-                "description": tool.description,
-                "url": tool.url,
-                "ring": tool.ring,
-                "quadrant": tool.quadrant,
-                "related_indicators": tool.related_indicators,
-            }
-            # Remove None values
-            tool_data = {k: v for k, v in tool_data.items() if v is not None}
-            tool_data = self._add_hateoas_links(tool_data, tool.id, "tools")
-            tool_data = self._add_timestamps(tool_data)
-
-            output_file = self.api_dir / "tools" / f"{tool.id}.json"
-            self._save_json(tool_data, output_file)
-
+            tool_data = _entity_dict(
+                self._tool_prelude,
+                ("id", tool.id),
+                ("name", tool.name),
+                ("description", tool.description),
+                ("url", tool.url),
+                ("ring", tool.ring),
+                ("quadrant", tool.quadrant),
+                ("related_indicators", tool.related_indicators),
+            )
+            self._add_item_links(tool_data, tools_url, tool.id)
+            tool_data["generated"] = self._generated_ts
+
+            entity_files.append((tool_data, tools_dir / f"{tool.id}.json"))
+
+        self._save_json_files(entity_files)
         logger.info(f"✓ Generated {len(tools)} individual tool files")
 
     def generate_tools_by_ring(self, tools: List[Tool]) -> None:
         """Generate tools grouped by ring."""
         logger.info("Generating tools by ring...")
+        tools_url = f"{self.base_url}/tools/"
 
         # Group tools by ring
-        by_ring: Dict[str, List[Tool]] = {}
+        by_ring: Dict[str, List[Tool]] = defaultdict(list)
         for tool in tools:
             if tool.ring:
-                if tool.ring not in by_ring:
-                    by_ring[tool.ring] = []
                 by_ring[tool.ring].append(tool)
 
         # Create directory
@@ -244,7 +601,7 @@ class APIGenerator:
                     {
                         "id": tool.id,
                         "name": tool.name,
-                        "url": f"{self.base_url}/tools/{tool.id}",
+                        "url": tools_url + tool.id,
                     }
                     for tool in tool_list
                 ],
@@ -259,13 +616,12 @@ class APIGenerator:
     def generate_tools_by_indicator(self, tools: List[Tool]) -> None:
         """Generate tools grouped by indicator."""
         logger.info("Generating tools by indicator...")
+        tools_url = f"{self.base_url}/tools/"
 
         # Group tools by indicator
-        by_indicator: Dict[str, List[Tool]] = {}
+        by_indicator: Dict[str, List[Tool]] = defaultdict(list)
         for tool in tools:
             for indicator_id in tool.related_indicators:
-                if indicator_id not in by_indicator:
-                    by_indicator[indicator_id] = []
                 by_indicator[indicator_id].append(tool)
 
         # Create directory
@@ -283,7 +639,7 @@ class APIGenerator:
                         "id": tool.id,
                         "name": tool.name,
                         "ring": tool.ring,
-                        "url": f"{self.base_url}/tools/{tool.id}",
+                        "url": tools_url + tool.id,
                     }
                     for tool in tool_list
                 ],
@@ -298,6 +654,9 @@ class APIGenerator:
     def generate_dimensions(self, dimensions: List[Dimension]) -> None:
         """Generate dimensions collection and individual endpoints."""
         logger.info(f"Generating {len(dimensions)} dimension endpoints...")
+        dimensions_url = f"{self.base_url}/dimensions/"
+        # Shared by the collection items and the individual dimension files
+        indicator_counts = [len(dim.indicators) for dim in dimensions]
 
         # Generate collection
         collection_data = {
@@ -311,38 +670,37 @@ class APIGenerator:
                     "id": dim.id,
                     "name": dim.name,
                     "description": dim.description,
-                    "indicator_count": len(dim.indicators),
-                    "url": f"{self.base_url}/dimensions/{dim.id}",
+                    "indicator_count": indicator_count,
+                    "url": dimensions_url + dim.id,
                 }
-                for dim in dimensions
+                for dim, indicator_count in zip(dimensions, indicator_counts)
             ],
         }
-        collection_data = self._add_hateoas_links(collection_data, entity_type="dimensions")
+        collection_data = self._add_collection_links(collection_data, dimensions_url)
         collection_data = self._add_timestamps(collection_data)
 
-        output_file = self.api_dir / "dimensions" / "index.json"
+        dimensions_dir = self.api_dir / "dimensions"
+        output_file = dimensions_dir / "index.json"
         self._save_json(collection_data, output_file)
         logger.info(f"✓ Generated dimensions collection: {output_file}")
 
         # Generate individual dimension files
-        for dimension in dimensions:
-            dimension_data = {
-                "@context": self.api_context,
-                "@type": "Dimension",
-                "id": dimension.id,
-                "name": dimension.name,
-                "description": dimension.description,
-                "indicators": dimension.indicators,
-                "indicator_count": len(dimension.indicators),
-            }
-            # Remove None values
-            dimension_data = {k: v for k, v in dimension_data.items() if v is not None}
-            dimension_data = self._add_hateoas_links(dimension_data, dimension.id, "dimensions")
-            dimension_data = self._add_timestamps(dimension_data)
-
-            output_file = self.api_dir / "dimensions" / f"{dimension.id}.json"
-            self._save_json(dimension_data, output_file)
-
+        entity_files = []
+        for dimension, indicator_count in zip(dimensions, indicator_counts):
+            dimension_data = _entity_dict(
+                self._dimension_prelude,
+                ("id", dimension.id),
+                ("name", dimension.name),
+                ("description", dimension.description),
+                ("indicators", dimension.indicators),
+                ("indicator_count", indicator_count),
+            )
+            self._add_item_links(dimension_data, dimensions_url, dimension.id)
+            dimension_data["generated"] = self._generated_ts
+
+            entity_files.append((dimension_data, dimensions_dir / f"{dimension.id}.json"))
+
+        self._save_json_files(entity_files)
         logger.info(f"✓ Generated {len(dimensions)} individual dimension files")
 
     def generate_relationships_graph(self, graph_data: Dict[str, Any]) -> None:
@@ -366,245 +724,9 @@ class APIGenerator:
         """Generate OpenAPI specification."""
         logger.info("Generating OpenAPI specification...")
 
-        spec = {
-            "openapi": "3.0.0",
-            "info": {
-                "title": "EVERSE Unified API",
-                "description": "Unified API for EVERSE research software quality services",
-                "version": self.api_version,
-                "contact": {
-                    "name": "EVERSE Technical Team",
-                    "url": "https://everse.software/",
-                },
-                "license": {
-                    "name": "Apache 2.0",
-                    "url": "https://www.apache.org/licenses/LICENSE-2.0",
-                },
-            },
-            "servers": [
-                {
-                    "url": self.base_url,
-                    "description": "Production API",
-                }
-            ],
-            "paths": {
-                "/": {
-                    "get": {
-                        "summary": "API Root",
-                        "description": "Get available endpoints",
-                        "responses": {
-                            "200": {
-                                "description": "API root information",
-                            }
-                        },
-                    }
-                },
-                "/indicators/": {
-                    "get": {
-                        "summary": "List Indicators",
-                        "description": "Get all quality indicators",
-                        "parameters": [
-                            {
-                                "name": "dimension",
-                                "in": "query",
-                                "description": "Filter by dimension",
-                                "schema": {"type": "string"},
-                            }
-                        ],
-                        "responses": {
-                            "200": {
-                                "description": "List of indicators",
-                            }
-                        },
-                    }
-                },
-                "/indicators/{id}": {
-                    "get": {
-                        "summary": "Get Indicator",
-                        "description": "Get specific indicator details",
-                        "parameters": [
-                            {
-                                "name": "id",
-                                "in": "path",
-                                "required": True,
-                                "description": "Indicator ID",
-                                "schema": {"type": "string"},
-                            }
-                        ],
-                        "responses": {
-                            "200": {
-                                "description": "Indicator details",
-                            },
-                            "404": {
-                                "description": "Indicator not found",
-                            },
-                        },
-                    }
-                },
-                "/tools/": {
-                    "get": {
-                        "summary": "List Tools",
-                        "description": "Get all quality assessment tools",
-                        "parameters": [
-                            {
-                                "name": "ring",
-                                "in": "query",
-                                "description": "Filter by ring (adopt, trial, assess, hold)",
-                                "schema": {"type": "string", "enum": ["adopt", "trial", "assess", "hold"]},
-                            },
-                            {
-                                "name": "quadrant",
-                                "in": "query",
-                                "description": "Filter by quadrant",
-                                "schema": {"type": "string"},
-                            },
-                        ],
-                        "responses": {
-                            "200": {
-                                "description": "List of tools",
-                            }
-                        },
-                    }
-                },
-                "/tools/{id}": {
-                    "get": {
-                        "summary": "Get Tool",
-                        "description": "Get specific tool details",
-                        "parameters": [
-                            {
-                                "name": "id",
-                                "in": "path",
-                                "required": True,
-                                "description": "Tool ID",
-                                "schema": {"type": "string"},
-                            }
-                        ],
-                        "responses": {
-                            "200": {
-                                "description": "Tool details",
-                            },
-                            "404": {
-                                "description": "Tool not found",
-                            },
-                        },
-                    }
-                },
-                "/tools/by-indicator/{indicator_id}": {
-                    "get": {
-                        "summary": "Get Tools for Indicator",
-                        "description": "Get all tools that measure a specific indicator",
-                        "parameters": [
-                            {
-                                "name": "indicator_id",
-                                "in": "path",
-                                "required": True,
-                                "description": "Indicator ID",
-                                "schema": {"type": "string"},
-                            }
-                        ],
-                        "responses": {
-                            "200": {
-                                "description": "List of tools for the indicator",
-                            }
-                        },
-                    }
-                },
-                "/dimensions/": {
-                    "get": {
-                        "summary": "List Dimensions",
-                        "description": "Get all quality dimensions",
-                        "responses": {
-                            "200": {
-                                "description": "List of dimensions",
-                            }
-                        },
-                    }
-                },
-                "/dimensions/{id}": {
-                    "get": {
-                        "summary": "Get Dimension",
-                        "description": "Get specific dimension details",
-                        "parameters": [
-                            {
-                                "name": "id",
-                                "in": "path",
-                                "required": True,
-                                "description": "Dimension ID",
-                                "schema": {"type": "string"},
-                            }
-                        ],
-                        "responses": {
-                            "200": {
-                                "description": "Dimension details",
-                            },
-                            "404": {
-                                "description": "Dimension not found",
-                            },
-                        },
-                    }
-                },
-                "/relationships/graph": {
-                    "get": {
-                        "summary": "Get Relationship Graph",
-                        "description": "Get knowledge graph of all relationships",
-                        "parameters": [
-                            {
-                                "name": "format",
-                                "in": "query",
-                                "description": "Output format",
-                                "schema": {"type": "string", "enum": ["json", "graphviz"]},
-                            },
-                            {
-                                "name": "depth",
-                                "in": "query",
-                                "description": "Relationship depth",
-                                "schema": {"type": "integer", "default": 2},
-                            },
-                        ],
-                        "responses": {
-                            "200": {
-                                "description": "Relationship graph",
-                            }
-                        },
-                    }
-                },
-            },
-            "components": {
-                "schemas": {
-                    "Indicator": {
-                        "type": "object",
-                        "properties": {
-                            "id": {"type": "string"},
-                            "name": {"type": "string"},
-                            "description": {"type": "string"},
-                            "dimension": {"type": "string"},
-                            "category": {"type": "string"},
-                            "related_tools": {"type": "array", "items": {"type": "string"}},
-                        },
-                    },
-                    "Tool": {
-                        "type": "object",
-                        "properties": {
-                            "id": {"type": "string"},
-                            "name": {"type": "string"},
-                            "description": {"type": "string"},
-                            "url": {"type": "string", "format": "uri"},
-                            "ring": {"type": "string", "enum": ["adopt", "trial", "assess", "hold"]},
-                            "related_indicators": {"type": "array", "items": {"type": "string"}},
-                        },
-                    },
-                    "Dimension": {
-                        "type": "object",
-                        "properties": {
-                            "id": {"type": "string"},
-                            "name": {"type": "string"},
-                            "description": {"type": "string"},
-                            "indicators": {"type": "array", "items": {"type": "string"}},
-                        },
-                    },
-                }
-            },
-        }
+        spec = copy.deepcopy(_OPENAPI_SPEC_TEMPLATE)
+        spec["info"]["version"] = self.api_version
+        spec["servers"][0]["url"] = self.base_url
 
         output_file = self.api_dir / "openapi.json"
         self._save_json(spec, output_file)
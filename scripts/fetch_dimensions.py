@@ -4,7 +4,16 @@ import logging
 from pathlib import Path
 from typing import Dict, List, Optional
 
-from scripts.utils import fetch_json, list_github_files, get_raw_github_url, save_json, load_json
+import orjson
+from pydantic import TypeAdapter
+
+from scripts.utils import (
+    drop_duplicate_ids,
+    fetch_github_json_files,
+    memoized_fetch,
+    load_json,
+    validate_batch,
+)
 from scripts.models import Dimension
 from scripts.config import CACHE_DIR
 
@@ -14,37 +23,29 @@ DIMENSIONS_OWNER = "EVERSE-ResearchSoftware"
 DIMENSIONS_REPO = "indicators"
 DIMENSIONS_PATH = "dimensions"
 
+# Blob SHA, ETag and contents of each raw file, keyed by repository path
+FILE_CACHE_FILE = CACHE_DIR / "dimensions_files.json"
+
+# Bump when the Dimension model changes so caches written by older code are refetched
+CACHE_VERSION = 1
+
+_DIMENSION_LIST = TypeAdapter(List[Dimension])
+
 
 def fetch_dimensions_from_github() -> List[Dict]:
     """
     Fetch all dimension JSON files from the indicators repository.
 
+    Only files changed since the previous run are downloaded.
+
     Returns:
         List of dimension data dictionaries
     """
     logger.info("Fetching dimensions from GitHub...")
 
-    # List all files in the dimensions directory
-    files = list_github_files(DIMENSIONS_OWNER, DIMENSIONS_REPO, DIMENSIONS_PATH)
-
-    if not files:
-        logger.error("Failed to list dimension files from GitHub")
-        return []
-
-    dimensions = []
-
-    for file_info in files:
-        if file_info.get("name", "").endswith(".json"):
-            file_path = file_info.get("path", "")
-            url = get_raw_github_url(DIMENSIONS_OWNER, DIMENSIONS_REPO, file_path)
-
-            logger.info(f"Fetching dimension: {file_info['name']}")
-            dimension_data = fetch_json(url)
-
-            if dimension_data:
-                dimensions.append(dimension_data)
-            else:
-                logger.warning(f"Failed to fetch {file_info['name']}")
+    dimensions = fetch_github_json_files(
+        DIMENSIONS_OWNER, DIMENSIONS_REPO, DIMENSIONS_PATH, FILE_CACHE_FILE, "dimension"
+    )
 
     logger.info(f"Successfully fetched {len(dimensions)} dimensions")
     return dimensions
@@ -62,33 +63,33 @@ def validate_dimensions(dimensions: List[Dict]) -> List[Dimension]:
     """
     logger.info(f"Validating {len(dimensions)} dimensions...")
 
-    validated = []
-    errors = []
+    records = []
 
     for dimension_data in dimensions:
-        try:
-            # Extract required fields - handle JSON-LD @id field
-            dimension_id = dimension_data.get("id") or dimension_data.get("@id")
-            name = dimension_data.get("name")
-
-            if not dimension_id or not name:
-                logger.warning(f"Skipping dimension without id or name: {dimension_data}")
-                continue
-
-            # Create Dimension model
-            dimension = Dimension(
-                id=dimension_id,
-                name=name,
-                description=dimension_data.get("description"),
-                indicators=dimension_data.get("indicators", []),
-                metadata=dimension_data,
-            )
-            validated.append(dimension)
-
-        except Exception as e:
-            error_msg = f"Validation error for dimension {dimension_data.get('id', 'unknown')}: {e}"
-            logger.error(error_msg)
-            errors.append(error_msg)
+        # Extract required fields - handle JSON-LD @id field
+        dimension_id = dimension_data.get("id") or dimension_data.get("@id")
+        name = dimension_data.get("name")
+
+        if not dimension_id or not name:
+            logger.warning(f"Skipping dimension without id or name: {dimension_data}")
+            continue
+
+        records.append(
+            {
+                "id": dimension_id,
+                "name": name,
+                "description": dimension_data.get("description"),
+                "indicators": dimension_data.get("indicators", []),
+                "metadata": dimension_data,
+            }
+        )
+
+    records = drop_duplicate_ids(records, "dimension")
+
+    # Validate the whole batch in one pydantic-core call
+    validated, errors = validate_batch(_DIMENSION_LIST, records, "dimension")
+    for error_msg in errors:
+        logger.error(error_msg)
 
     if errors:
         logger.warning(f"Found {len(errors)} validation errors")
@@ -109,13 +110,22 @@ def save_dimensions_cache(dimensions: List[Dimension]) -> Path:
     """
     cache_file = CACHE_DIR / "dimensions.json"
 
-    data = {
-        "type": "DimensionCollection",
-        "items": [dimension.model_dump() for dimension in dimensions],
-        "count": len(dimensions),
-    }
-
-    save_json(data, cache_file)
+    # Stream each dimension straight to disk instead of building the whole document
+    # and walking it again in save_json
+    cache_file.parent.mkdir(parents=True, exist_ok=True)
+    with open(cache_file, "wb") as f:
+        f.write(b'{"type":"DimensionCollection","version":')
+        f.write(orjson.dumps(CACHE_VERSION))
+        f.write(b',"items":[')
+        for index, dimension in enumerate(dimensions):
+            if index:
+                f.write(b",")
+            f.write(orjson.dumps(dimension.model_dump(mode="json")))
+        f.write(b'],"count":')
+        f.write(orjson.dumps(len(dimensions)))
+        f.write(b"}")
+
+    logger.info(f"Saved JSON to {cache_file}")
     return cache_file
 
 
@@ -132,34 +142,48 @@ def load_dimensions_cache() -> Optional[List[Dimension]]:
     if not data:
         return None
 
+    if data.get("version") != CACHE_VERSION:
+        logger.info("Dimensions cache was written by an older version, ignoring it")
+        return None
+
     try:
         items = data.get("items", [])
-        return [Dimension(**item) for item in items]
+        # Cached items were validated before they were written, so skip re-validation
+        return [Dimension.model_construct(**item) for item in items]
     except Exception as e:
         logger.error(f"Failed to load dimensions cache: {e}")
         return None
 
 
+def _fetch_dimensions() -> List[Dimension]:
+    """Fetch dimensions from GitHub, validate them and refresh the cache file."""
+    raw_dimensions = fetch_dimensions_from_github()
+    validated = validate_dimensions(raw_dimensions)
+
+    if validated:
+        save_dimensions_cache(validated)
+
+    return validated
+
+
+_get_dimensions = memoized_fetch(load_dimensions_cache, _fetch_dimensions, "dimensions")
+
+
 def fetch_and_validate_dimensions(use_cache: bool = True) -> List[Dimension]:
     """
     Fetch and validate dimensions.
 
+    The result is memoized for the process; fetch_and_validate_dimensions.cache_clear()
+    forgets it. The Dimension models are shared by every caller, even though the list
+    itself is new each time; take a copy before editing one.
+
     Args:
         use_cache: Whether to try loading from cache first
 
     Returns:
         List of validated dimensions
     """
-    if use_cache:
-        cached = load_dimensions_cache()
-        if cached:
-            logger.info(f"Loaded {len(cached)} dimensions from cache")
-            return cached
+    return _get_dimensions(use_cache)
 
-    raw_dimensions = fetch_dimensions_from_github()
-    validated = validate_dimensions(raw_dimensions)
 
-    if validated:
-        save_dimensions_cache(validated)
-
-    return validated
+fetch_and_validate_dimensions.cache_clear = _get_dimensions.cache_clear
@@ -1,10 +1,20 @@
 """Fetch indicators from the EVERSE indicators repository."""
 
 import logging
+from operator import itemgetter
 from pathlib import Path
 from typing import Dict, List, Optional
 
-from scripts.utils import fetch_json, list_github_files, get_raw_github_url, save_json, load_json
+from pydantic import HttpUrl, TypeAdapter
+
+from scripts.utils import (
+    drop_duplicate_ids,
+    fetch_github_json_files,
+    memoized_fetch,
+    save_json,
+    load_json,
+    validate_batch,
+)
 from scripts.models import Indicator
 from scripts.config import CACHE_DIR
 
@@ -14,37 +24,47 @@ INDICATORS_OWNER = "EVERSE-ResearchSoftware"
 INDICATORS_REPO = "indicators"
 INDICATORS_PATH = "indicators"
 
+# Blob SHA, ETag and contents of each raw file, keyed by repository path
+FILE_CACHE_FILE = CACHE_DIR / "indicators_files.json"
+
+# Bump when the cache layout or the Indicator model changes so caches written by older code are re-validated
+CACHE_VERSION = 2
+
+_INDICATOR_LIST = TypeAdapter(List[Indicator])
+_HTTP_URL = TypeAdapter(HttpUrl)
+
+# Raw keys copied into dedicated Indicator fields
+_EXTRACTED_FIELDS = frozenset(
+    {"id", "@id", "name", "description", "dimension", "category", "rationale", "url", "related_tools"}
+)
+
+# Fields stored in each cache row, in order
+_CACHE_COLUMNS = list(Indicator.model_fields)
+_cache_row = itemgetter(*_CACHE_COLUMNS)
+
+
+def _construct_indicator(item: Dict) -> Indicator:
+    """Build an Indicator from trusted cache data without validating it."""
+    # The cache stores URLs as plain strings; restore the HttpUrl type the serializer expects
+    if item.get("url") is not None:
+        item["url"] = _HTTP_URL.validate_python(item["url"])
+    return Indicator.model_construct(**item)
+
 
 def fetch_indicators_from_github() -> List[Dict]:
     """
     Fetch all indicator JSON files from the indicators repository.
 
+    Only files changed since the previous run are downloaded.
+
     Returns:
         List of indicator data dictionaries
     """
     logger.info("Fetching indicators from GitHub...")
 
-    # List all files in the indicators directory
-    files = list_github_files(INDICATORS_OWNER, INDICATORS_REPO, INDICATORS_PATH)
-
-    if not files:
-        logger.error("Failed to list indicator files from GitHub")
-        return []
-
-    indicators = []
-
-    for file_info in files:
-        if file_info.get("name", "").endswith(".json"):
-            file_path = file_info.get("path", "")
-            url = get_raw_github_url(INDICATORS_OWNER, INDICATORS_REPO, file_path)
-
-            logger.info(f"Fetching indicator: {file_info['name']}")
-            indicator_data = fetch_json(url)
-
-            if indicator_data:
-                indicators.append(indicator_data)
-            else:
-                logger.warning(f"Failed to fetch {file_info['name']}")
+    indicators = fetch_github_json_files(
+        INDICATORS_OWNER, INDICATORS_REPO, INDICATORS_PATH, FILE_CACHE_FILE, "indicator"
+    )
 
     logger.info(f"Successfully fetched {len(indicators)} indicators")
     return indicators
@@ -62,37 +82,41 @@ def validate_indicators(indicators: List[Dict]) -> List[Indicator]:
     """
     logger.info(f"Validating {len(indicators)} indicators...")
 
-    validated = []
-    errors = []
+    records = []
 
     for indicator_data in indicators:
-        try:
-            # Extract required fields - handle JSON-LD @id field
-            indicator_id = indicator_data.get("id") or indicator_data.get("@id")
-            name = indicator_data.get("name")
-
-            if not indicator_id or not name:
-                logger.warning(f"Skipping indicator without id or name: {indicator_data}")
-                continue
-
-            # Create Indicator model
-            indicator = Indicator(
-                id=indicator_id,
-                name=name,
-                description=indicator_data.get("description"),
-                dimension=indicator_data.get("dimension"),
-                category=indicator_data.get("category"),
-                rationale=indicator_data.get("rationale"),
-                url=indicator_data.get("url"),
-                related_tools=indicator_data.get("related_tools", []),
-                metadata=indicator_data,
-            )
-            validated.append(indicator)
-
-        except Exception as e:
-            error_msg = f"Validation error for indicator {indicator_data.get('id', 'unknown')}: {e}"
-            logger.error(error_msg)
-            errors.append(error_msg)
+        # Bind the lookup once, since every field below goes through it
+        get = indicator_data.get
+
+        # Extract required fields - handle JSON-LD @id field
+        indicator_id = get("id") or get("@id")
+        name = get("name")
+
+        if not indicator_id or not name:
+            logger.warning(f"Skipping indicator without id or name: {indicator_data}")
+            continue
+
+        records.append(
+            {
+                "id": indicator_id,
+                "name": name,
+                "description": get("description"),
+                "dimension": get("dimension"),
+                "category": get("category"),
+                "rationale": get("rationale"),
+                "url": get("url"),
+                "related_tools": get("related_tools", []),
+                # Only keep what the model doesn't already hold, rather than a second copy of the file
+                "metadata": {key: value for key, value in indicator_data.items() if key not in _EXTRACTED_FIELDS},
+            }
+        )
+
+    records = drop_duplicate_ids(records, "indicator")
+
+    # Validate the whole batch in one pydantic-core call
+    validated, errors = validate_batch(_INDICATOR_LIST, records, "indicator")
+    for error_msg in errors:
+        logger.error(error_msg)
 
     if errors:
         logger.warning(f"Found {len(errors)} validation errors")
@@ -115,7 +139,11 @@ def save_indicators_cache(indicators: List[Indicator]) -> Path:
 
     data = {
         "type": "IndicatorCollection",
-        "items": [indicator.model_dump() for indicator in indicators],
+        "version": CACHE_VERSION,
+        # Columnar layout: field names are stored once instead of in every item.
+        # Values are read straight from the model; save_json serializes the URLs
+        "columns": _CACHE_COLUMNS,
+        "rows": [_cache_row(indicator.__dict__) for indicator in indicators],
         "count": len(indicators),
     }
 
@@ -130,42 +158,53 @@ def load_indicators_cache() -> Optional[List[Indicator]]:
     Returns:
         List of indicators or None if cache doesn't exist
     """
-    from pathlib import Path
-
-    cache_file = Path(CACHE_DIR) / "indicators.json"
+    cache_file = CACHE_DIR / "indicators.json"
 
     data = load_json(cache_file)
     if not data:
         return None
 
     try:
-        items = data.get("items", [])
-        return [Indicator(**item) for item in items]
+        if data.get("version") != CACHE_VERSION:
+            # Written by older code, so the items can't be trusted as-is
+            return _INDICATOR_LIST.validate_python(data.get("items", []))
+        # Items were validated before they were written, so skip re-validation
+        columns = data["columns"]
+        return [_construct_indicator(dict(zip(columns, row))) for row in data.get("rows", [])]
     except Exception as e:
         logger.error(f"Failed to load indicators cache: {e}")
         return None
 
 
+def _fetch_indicators() -> List[Indicator]:
+    """Fetch indicators from GitHub, validate them and refresh the cache file."""
+    raw_indicators = fetch_indicators_from_github()
+    validated = validate_indicators(raw_indicators)
+
+    if validated:
+        save_indicators_cache(validated)
+
+    return validated
+
+
+_get_indicators = memoized_fetch(load_indicators_cache, _fetch_indicators, "indicators")
+
+
 def fetch_and_validate_indicators(use_cache: bool = True) -> List[Indicator]:
     """
     Fetch and validate indicators.
 
+    The result is memoized for the process; fetch_and_validate_indicators.cache_clear()
+    forgets it. Each call returns a fresh list whose Indicator models are shared between
+    callers, so copy an indicator rather than changing it in place.
+
     Args:
         use_cache: Whether to try loading from cache first
 
     Returns:
         List of validated indicators
     """
-    if use_cache:
-        cached = load_indicators_cache()
-        if cached:
-            logger.info(f"Loaded {len(cached)} indicators from cache")
-            return cached
-
-    raw_indicators = fetch_indicators_from_github()
-    validated = validate_indicators(raw_indicators)
+    return _get_indicators(use_cache)
 
-    if validated:
-        save_indicators_cache(validated)
 
-    return validated
+fetch_and_validate_indicators.cache_clear = _get_indicators.cache_clear
@@ -1,10 +1,20 @@
 """Fetch tools from the EVERSE TechRadar repository."""
 
 import logging
+from operator import itemgetter
 from pathlib import Path
 from typing import Dict, List, Optional
 
-from scripts.utils import fetch_json, list_github_files, get_raw_github_url, save_json, load_json
+from pydantic import HttpUrl, TypeAdapter
+
+from scripts.utils import (
+    drop_duplicate_ids,
+    fetch_github_json_files,
+    memoized_fetch,
+    save_json,
+    load_json,
+    validate_batch,
+)
 from scripts.models import Tool
 from scripts.config import CACHE_DIR
 
@@ -14,37 +24,43 @@ TOOLS_OWNER = "EVERSE-ResearchSoftware"
 TOOLS_REPO = "TechRadar"
 TOOLS_PATH = "data/software-tools"
 
+# Blob SHA, ETag and contents of each raw file, keyed by repository path
+FILE_CACHE_FILE = CACHE_DIR / "tools_files.json"
+
+# Bump when the cache layout or the Tool model changes so caches written by older code are re-validated
+CACHE_VERSION = 3
+
+_TOOL_LIST = TypeAdapter(List[Tool])
+_HTTP_URL = TypeAdapter(HttpUrl)
+
+# Raw keys copied into dedicated Tool fields
+_EXTRACTED_FIELDS = frozenset({"id", "@id", "name", "description", "url", "ring", "quadrant", "related_indicators"})
+
+# Fields stored in each cache row, in order
+_CACHE_COLUMNS = list(Tool.model_fields)
+_cache_row = itemgetter(*_CACHE_COLUMNS)
+
+
+def _construct_tool(item: Dict) -> Tool:
+    """Build a Tool from trusted cache data without validating it."""
+    # The cache stores URLs as plain strings; restore the HttpUrl type the serializer expects
+    if item.get("url") is not None:
+        item["url"] = _HTTP_URL.validate_python(item["url"])
+    return Tool.model_construct(**item)
+
 
 def fetch_tools_from_github() -> List[Dict]:
     """
     Fetch all tool JSON files from the TechRadar repository.
 
+    Only files changed since the previous run are downloaded.
+
     Returns:
         List of tool data dictionaries
     """
     logger.info("Fetching tools from GitHub...")
 
-    # List all files in the tools directory
-    files = list_github_files(TOOLS_OWNER, TOOLS_REPO, TOOLS_PATH)
-
-    if not files:
-        logger.error("Failed to list tool files from GitHub")
-        return []
-
-    tools = []
-
-    for file_info in files:
-        if file_info.get("name", "").endswith(".json"):
-            file_path = file_info.get("path", "")
-            url = get_raw_github_url(TOOLS_OWNER, TOOLS_REPO, file_path)
-
-            logger.info(f"Fetching tool: {file_info['name']}")
-            tool_data = fetch_json(url)
-
-            if tool_data:
-                tools.append(tool_data)
-            else:
-                logger.warning(f"Failed to fetch {file_info['name']}")
+    tools = fetch_github_json_files(TOOLS_OWNER, TOOLS_REPO, TOOLS_PATH, FILE_CACHE_FILE, "tool")
 
     logger.info(f"Successfully fetched {len(tools)} tools")
     return tools
@@ -62,36 +78,40 @@ def validate_tools(tools: List[Dict]) -> List[Tool]:
     """
     logger.info(f"Validating {len(tools)} tools...")
 
-    validated = []
-    errors = []
+    records = []
 
     for tool_data in tools:
-        try:
-            # Extract required fields - handle JSON-LD @id field
-            tool_id = tool_data.get("id") or tool_data.get("@id")
-            name = tool_data.get("name")
-
-            if not tool_id or not name:
-                logger.warning(f"Skipping tool without id or name: {tool_data}")
-                continue
-
-            # Create Tool model
-            tool = Tool(
-                id=tool_id,
-                name=name,
-                description=tool_data.get("description"),
-                url=tool_data.get("url"),
-                ring=tool_data.get("ring"),
-                quadrant=tool_data.get("quadrant"),
-                related_indicators=tool_data.get("related_indicators", []),
-                metadata=tool_data,
-            )
-            validated.append(tool)
-
-        except Exception as e:
-            error_msg = f"Validation error for tool {tool_data.get('id', 'unknown')}: {e}"
-            logger.error(error_msg)
-            errors.append(error_msg)
+        # Bind the lookup once, since every field below goes through it
+        get = tool_data.get
+
+        # Extract required fields - handle JSON-LD @id field
+        tool_id = get("id") or get("@id")
+        name = get("name")
+
+        if not tool_id or not name:
+            logger.warning(f"Skipping tool without id or name: {tool_data}")
+            continue
+
+        records.append(
+            {
+                "id": tool_id,
+                "name": name,
+                "description": get("description"),
+                "url": get("url"),
+                "ring": get("ring"),
+                "quadrant": get("quadrant"),
+                "related_indicators": get("related_indicators", []),
+                # Only keep what the model doesn't already hold, rather than a second copy of the file
+                "metadata": {key: value for key, value in tool_data.items() if key not in _EXTRACTED_FIELDS},
+            }
+        )
+
+    records = drop_duplicate_ids(records, "tool")
+
+    # Validate the whole batch in one pydantic-core call
+    validated, errors = validate_batch(_TOOL_LIST, records, "tool")
+    for error_msg in errors:
+        logger.error(error_msg)
 
     if errors:
         logger.warning(f"Found {len(errors)} validation errors")
@@ -114,7 +134,11 @@ def save_tools_cache(tools: List[Tool]) -> Path:
 
     data = {
         "type": "ToolCollection",
-        "items": tools,  # Let save_json handle the conversion
+        "version": CACHE_VERSION,
+        # Columnar layout: field names are stored once instead of in every item.
+        # Values are read straight from the model; save_json serializes the URLs
+        "columns": _CACHE_COLUMNS,
+        "rows": [_cache_row(tool.__dict__) for tool in tools],
         "count": len(tools),
     }
 
@@ -129,45 +153,56 @@ def load_tools_cache() -> Optional[List[Tool]]:
     Returns:
         List of tools or None if cache doesn't exist
     """
-    from pathlib import Path
-
-    cache_file = Path(CACHE_DIR) / "tools.json"
+    cache_file = CACHE_DIR / "tools.json"
 
     data = load_json(cache_file)
     if not data:
         return None
 
     try:
-        items = data.get("items", [])
-        return [Tool(**item) for item in items]
+        if data.get("version") != CACHE_VERSION:
+            # Written by older code, so the items can't be trusted as-is
+            return _TOOL_LIST.validate_python(data.get("items", []))
+        # Items were validated before they were written, so skip re-validation
+        columns = data["columns"]
+        return [_construct_tool(dict(zip(columns, row))) for row in data.get("rows", [])]
     except Exception as e:
         logger.error(f"Failed to load tools cache: {e}")
         return None
 
 
+def _fetch_tools() -> List[Tool]:
+    """Fetch tools from GitHub, validate them and refresh the cache file."""
+    raw_tools = fetch_tools_from_github()
+    validated = validate_tools(raw_tools)
+
+    if validated:
+        try:
+            save_tools_cache(validated)
+        except Exception as e:
+            logger.warning(f"Failed to save tools cache: {e}. Continuing without cache.")
+
+    return validated
+
+
+_get_tools = memoized_fetch(load_tools_cache, _fetch_tools, "tools")
+
+
 def fetch_and_validate_tools(use_cache: bool = True) -> List[Tool]:
     """
     Fetch and validate tools.
 
+    The result is memoized for the process; fetch_and_validate_tools.cache_clear()
+    forgets it. The list is new on every call, but the Tool models in it are shared with
+    other callers; copy a tool before modifying it.
+
     Args:
         use_cache: Whether to try loading from cache first
 
     Returns:
         List of validated tools
     """
-    if use_cache:
-        cached = load_tools_cache()
-        if cached:
-            logger.info(f"Loaded {len(cached)} tools from cache")
-            return cached
+    return _get_tools(use_cache)
 
-    raw_tools = fetch_tools_from_github()
-    validated = validate_tools(raw_tools)
-
-    if validated:
-        try:
-            save_tools_cache(validated)
-        except Exception as e:
-            logger.warning(f"Failed to save tools cache: {e}. Continuing without cache.")
 
-    return validated
+fetch_and_validate_tools.cache_clear = _get_tools.cache_clear
@@ -1,15 +1,21 @@
 """Main script to generate the EVERSE Unified API."""
 
+import gzip
+import hashlib
 import logging
-import json
+import os
 import sys
-from datetime import datetime
+import time
+from datetime import datetime, timezone
 from pathlib import Path
-from typing import List, Dict, Any, Tuple
+from typing import Any, Callable, Dict, List, Optional, Tuple
 from urllib.parse import urlencode
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
 import click
+import orjson
+from pydantic import TypeAdapter
 
 # Add parent directory to path to allow imports from anywhere
 sys.path.insert(0, str(Path(__file__).parent.parent))
@@ -19,17 +25,600 @@ from scripts.fetch_tools import fetch_and_validate_tools
 from scripts.fetch_dimensions import fetch_and_validate_dimensions
 from scripts.build_relationships import RelationshipBuilder
 from scripts.validate import validate_collections, validate_api_files
+from scripts.health_check import (
+    generate_health_endpoint,
+    generate_status_endpoint,
+    generate_dashboard,
+    generate_landing_page,
+)
 from scripts.models import APIResponse, Indicator, Tool, Dimension
-from scripts.config import API_DIR, API_VERSION, API_CONTEXT, API_BASE_URL
+from scripts.config import (
+    API_BASE_URL,
+    API_CONTEXT,
+    API_DIR,
+    API_VERSION,
+    CACHE_DIR,
+    CONCURRENT_SOURCES,
+    GZIP_JSON,
+    PRETTY_JSON,
+)
 
 logger = logging.getLogger(__name__)
 
+# Per-entity files are independent, so they are written from a thread pool
+_WRITE_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+
+# Write buffer for files encoded piece by piece
+_STREAM_BUFFER_SIZE = 1 << 20
+
+# Error lists are logged up to this many entries, followed by a count of the rest
+_MAX_LOGGED_ERRORS = 20
+
+# Whole collections are dumped in one call rather than model by model
+_INDICATOR_LIST = TypeAdapter(List[Indicator])
+_TOOL_LIST = TypeAdapter(List[Tool])
+_DIMENSION_LIST = TypeAdapter(List[Dimension])
+
+# Content hashes of the files written by previous runs, keyed by path relative to API_DIR.
+# Kept in the cache directory so the sidecar is never published with the API
+_HASHES_FILE = CACHE_DIR / "api_hashes.json"
+_content_hashes: Dict[str, str] = {}
+
+
+def _utc_timestamp() -> str:
+    """Return the current UTC time as an ISO 8601 timestamp with second precision."""
+    return time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime())
+
+
+# One timestamp per run, so files generated together carry the same value. main() takes
+# a fresh one when the run starts; importing the module only sets a default
+_GENERATED_AT = _utc_timestamp()
+
+
+def refresh_timestamp() -> None:
+    """Reset the generation timestamp stamped on every endpoint file."""
+    global _GENERATED_AT
+    _GENERATED_AT = _utc_timestamp()
+
+
+# Collection URLs shared by the links of every item
+_INDICATORS_URL = f"{API_BASE_URL}/indicators"
+_TOOLS_URL = f"{API_BASE_URL}/tools"
+_DIMENSIONS_URL = f"{API_BASE_URL}/dimensions"
+
+# Static OpenAPI document; only config values are interpolated, so it is built once per process
+_OPENAPI_SPEC: Dict[str, Any] = {
+    "openapi": "3.0.0",
+    "info": {
+        "title": "EVERSE Unified API",
+        "description": "Unified API for EVERSE research software quality services",
+        "version": API_VERSION,
+        "contact": {
+            "name": "EVERSE Team",
+        },
+        "license": {
+            "name": "Apache 2.0",
+        },
+    },
+    "servers": [
+        {
+            "url": API_BASE_URL,
+            "description": "EVERSE Unified API",
+        }
+    ],
+    "paths": {
+        "/": {
+            "get": {
+                "operationId": "getApiRoot",
+                "summary": "API Root",
+                "description": "Get the API root with links to all endpoints",
+                "tags": ["Root"],
+                "responses": {
+                    "200": {
+                        "description": "API root information",
+                        "content": {
+                            "application/json": {
+                                "schema": {
+                                    "type": "object",
+                                    "properties": {
+                                        "@context": {"type": "string"},
+                                        "@type": {"type": "string"},
+                                        "version": {"type": "string"},
+                                        "endpoints": {"type": "object"},
+                                    },
+                                }
+                            }
+                        },
+                    }
+                },
+            }
+        },
+        "/indicators": {
+            "get": {
+                "operationId": "listIndicators",
+                "summary": "List Indicators",
+                "description": "Get paginated list of all quality indicators",
+                "tags": ["Indicators"],
+                "parameters": [
+                    {
+                        "name": "page",
+                        "in": "query",
+                        "description": "Page number (default: 1)",
+                        "schema": {"type": "integer", "default": 1},
+                    },
+                    {
+                        "name": "per_page",
+                        "in": "query",
+                        "description": "Items per page (default: 50, max: 100)",
+                        "schema": {"type": "integer", "default": 50},
+                    },
+                ],
+                "responses": {
+                    "200": {
+                        "description": "Indicators collection",
+                    }
+                },
+            }
+        },
+        "/indicators/{id}": {
+            "get": {
+                "operationId": "getIndicator",
+                "summary": "Get Indicator",
+                "description": "Get a specific indicator by ID",
+                "tags": ["Indicators"],
+                "parameters": [
+                    {
+                        "name": "id",
+                        "in": "path",
+                        "required": True,
+                        "description": "Indicator ID",
+                        "schema": {"type": "string"},
+                    }
+                ],
+                "responses": {
+                    "200": {
+                        "description": "Indicator details",
+                    },
+                    "404": {
+                        "description": "Indicator not found",
+                    },
+                },
+            }
+        },
+        "/tools": {
+            "get": {
+                "operationId": "listTools",
+                "summary": "List Tools",
+                "description": "Get paginated list of all quality assessment tools",
+                "tags": ["Tools"],
+                "parameters": [
+                    {
+                        "name": "page",
+                        "in": "query",
+                        "description": "Page number (default: 1)",
+                        "schema": {"type": "integer", "default": 1},
+                    },
+                    {
+                        "name": "indicator",
+                        "in": "query",
+                        "description": "Filter by indicator ID",
+                        "schema": {"type": "string"},
+                    },
+                    {
+                        "name": "ring",
+                        "in": "query",
+                        "description": "Filter by ring (adopt, trial, assess, hold)",
+                        "schema": {"type": "string"},
+                    },
+                ],
+                "responses": {
+                    "200": {
+                        "description": "Tools collection",
+                    }
+                },
+            }
+        },
+        "/tools/{id}": {
+            "get": {
+                "operationId": "getTool",
+                "summary": "Get Tool",
+                "description": "Get a specific tool by ID",
+                "tags": ["Tools"],
+                "parameters": [
+                    {
+                        "name": "id",
+                        "in": "path",
+                        "required": True,
+                        "description": "Tool ID",
+                        "schema": {"type": "string"},
+                    }
+                ],
+                "responses": {
+                    "200": {
+                        "description": "Tool details",
+                    },
+                    "404": {
+                        "description": "Tool not found",
+                    },
+                },
+            }
+        },
+        "/tools/by-indicator/{indicator_id}": {
+            "get": {
+                "operationId": "getToolsByIndicator",
+                "summary": "Get Tools by Indicator",
+                "description": "Get all tools that measure a specific indicator",
+                "tags": ["Tools"],
+                "parameters": [
+                    {
+                        "name": "indicator_id",
+                        "in": "path",
+                        "required": True,
+                        "description": "Indicator ID",
+                        "schema": {"type": "string"},
+                    }
+                ],
+                "responses": {
+                    "200": {
+                        "description": "Tools for indicator",
+                    },
+                    "404": {
+                        "description": "Indicator not found",
+                    },
+                },
+            }
+        },
+        "/tools/by-ring/{ring}": {
+            "get": {
+                "operationId": "getToolsByRing",
+                "summary": "Get Tools by Ring",
+                "description": "Get all tools in a specific ring",
+                "tags": ["Tools"],
+                "parameters": [
+                    {
+                        "name": "ring",
+                        "in": "path",
+                        "required": True,
+                        "description": "Ring value (adopt, trial, assess, hold)",
+                        "schema": {"type": "string"},
+                    }
+                ],
+                "responses": {
+                    "200": {
+                        "description": "Tools by ring",
+                    },
+                    "404": {
+                        "description": "Ring not found",
+                    },
+                },
+            }
+        },
+        "/dimensions": {
+            "get": {
+                "operationId": "listDimensions",
+                "summary": "List Dimensions",
+                "description": "Get paginated list of all quality dimensions",
+                "tags": ["Dimensions"],
+                "parameters": [
+                    {
+                        "name": "page",
+                        "in": "query",
+                        "description": "Page number (default: 1)",
+                        "schema": {"type": "integer", "default": 1},
+                    }
+                ],
+                "responses": {
+                    "200": {
+                        "description": "Dimensions collection",
+                    }
+                },
+            }
+        },
+        "/dimensions/{id}": {
+            "get": {
+                "operationId": "getDimension",
+                "summary": "Get Dimension",
+                "description": "Get a specific dimension by ID",
+                "tags": ["Dimensions"],
+                "parameters": [
+                    {
+                        "name": "id",
+                        "in": "path",
+                        "required": True,
+                        "description": "Dimension ID",
+                        "schema": {"type": "string"},
+                    }
+                ],
+                "responses": {
+                    "200": {
+                        "description": "Dimension details",
+                    },
+                    "404": {
+                        "description": "Dimension not found",
+                    },
+                },
+            }
+        },
+        "/dimensions/{id}/indicators": {
+            "get": {
+                "operationId": "getDimensionIndicators",
+                "summary": "Get Dimension Indicators",
+                "description": "Get all indicators for a specific dimension",
+                "tags": ["Dimensions"],
+                "parameters": [
+                    {
+                        "name": "id",
+                        "in": "path",
+                        "required": True,
+                        "description": "Dimension ID",
+                        "schema": {"type": "string"},
+                    }
+                ],
+                "responses": {
+                    "200": {
+                        "description": "Indicators for dimension",
+                    },
+                    "404": {
+                        "description": "Dimension not found",
+                    },
+                },
+            }
+        },
+        "/relationships/graph": {
+            "get": {
+                "operationId": "getRelationshipsGraph",
+                "summary": "Get Relationships Graph",
+                "description": "Get the complete knowledge graph of relationships",
+                "tags": ["Relationships"],
+                "responses": {
+                    "200": {
+                        "description": "Relationships graph",
+                    }
+                },
+            }
+        },
+    },
+    "components": {
+        "schemas": {
+            "Indicator": {
+                "type": "object",
+                "properties": {
+                    "id": {"type": "string"},
+                    "name": {"type": "string"},
+                    "description": {"type": "string"},
+                    "dimension": {"type": "string"},
+                    "category": {"type": "string"},
+                    "rationale": {"type": "string"},
+                    "url": {"type": "string"},
+                    "_links": {"type": "object"},
+                },
+                "required": ["id", "name", "description"],
+            },
+            "Tool": {
+                "type": "object",
+                "properties": {
+                    "id": {"type": "string"},
+                    "name": {"type": "string"},
+                    "description": {"type": "string"},
+                    "url": {"type": "string"},
+                    "ring": {"type": "string"},
+                    "quadrant": {"type": "string"},
+                    "_links": {"type": "object"},
+                },
+                "required": ["id", "name", "description"],
+            },
+            "Dimension": {
+                "type": "object",
+                "properties": {
+                    "id": {"type": "string"},
+                    "name": {"type": "string"},
+                    "description": {"type": "string"},
+                    "indicators": {"type": "array", "items": {"type": "string"}},
+                    "_links": {"type": "object"},
+                },
+                "required": ["id", "name", "description"],
+            },
+        }
+    },
+    "tags": [
+        {
+            "name": "Root",
+            "description": "API root endpoint",
+        },
+        {
+            "name": "Indicators",
+            "description": "Quality indicators",
+        },
+        {
+            "name": "Tools",
+            "description": "Quality assessment tools",
+        },
+        {
+            "name": "Dimensions",
+            "description": "Quality dimensions",
+        },
+        {
+            "name": "Relationships",
+            "description": "Entity relationships graph",
+        },
+    ],
+}
+
+
+def _log_errors(errors: List[str]) -> None:
+    """Log the first _MAX_LOGGED_ERRORS errors and summarize the remainder."""
+    for error in errors[:_MAX_LOGGED_ERRORS]:
+        logger.error("  - %s", error)
+    if len(errors) > _MAX_LOGGED_ERRORS:
+        logger.error("  ... and %d more", len(errors) - _MAX_LOGGED_ERRORS)
+
+
+def _run_concurrently(tasks: List[Tuple[Any, ...]]) -> None:
+    """Run independent (function, *args) generation steps on a thread pool, re-raising the first failure."""
+    with ThreadPoolExecutor(max_workers=len(tasks)) as executor:
+        futures = [executor.submit(*task) for task in tasks]
+        for future in as_completed(futures):
+            future.result()
+
+
+def _dump_by_id(adapter: TypeAdapter, entities: List[Any]) -> Dict[str, Dict[str, Any]]:
+    """Dump entities to JSON-compatible dicts in a single pydantic-core call, keyed by id."""
+    return dict(zip([entity.id for entity in entities], adapter.dump_python(entities, mode="json")))
+
+
+def _load_content_hashes() -> None:
+    """Load the content hashes recorded by the previous run."""
+    if _HASHES_FILE.exists():
+        _content_hashes.update(orjson.loads(_HASHES_FILE.read_bytes()))
+
+
+def _save_content_hashes() -> None:
+    """Record the content hashes of the generated files for the next run."""
+    _HASHES_FILE.write_bytes(orjson.dumps(_content_hashes, option=orjson.OPT_SORT_KEYS))
+
+
+def _write_json(output_file: Path, data: Dict[str, Any], pretty: bool = PRETTY_JSON) -> None:
+    """
+    Write data to a JSON file with a single write call, indented only when pretty is set.
+
+    Files whose content, apart from the generation timestamp, is unchanged since the last run are left as they are.
+    """
+    option = orjson.OPT_INDENT_2 if pretty else None
+
+    # Hash without the per-run timestamp so unchanged endpoints keep their previous file
+    relpath = output_file.relative_to(API_DIR).as_posix()
+    content = orjson.dumps({key: value for key, value in data.items() if key != "generated"}, option=option)
+    content_hash = hashlib.blake2b(content, digest_size=16).hexdigest()
+    unchanged = _content_hashes.get(relpath) == content_hash and output_file.exists()
+    if unchanged and (not GZIP_JSON or output_file.with_name(output_file.name + ".gz").exists()):
+        return
+    _content_hashes[relpath] = content_hash
+
+    # orjson encodes the whole document to UTF-8 bytes in one C call
+    payload = orjson.dumps(data, option=option)
+    output_file.write_bytes(payload)
+    if GZIP_JSON:
+        _write_gzip(output_file, payload)
+
+
+def _write_gzip(output_file: Path, payload: bytes) -> None:
+    """Write a gzip-compressed copy of a generated file alongside it, for servers that serve it as-is."""
+    # A fixed mtime keeps the archive identical across runs when the payload is unchanged
+    output_file.with_name(output_file.name + ".gz").write_bytes(gzip.compress(payload, compresslevel=6, mtime=0))
+
+
+def _write_json_files(files: List[Tuple[Path, Any]], write_pool: Optional[ThreadPoolExecutor] = None) -> None:
+    """Write (output_file, data) pairs concurrently, on write_pool if given or else on a pool of their own."""
+    if write_pool is None:
+        with ThreadPoolExecutor(max_workers=_WRITE_WORKERS) as executor:
+            _write_json_files(files, executor)
+        return
+
+    # Consume the results so that any write error is raised here
+    list(write_pool.map(lambda item: _write_json(*item), files))
+
+
+def _stream_json(output_file: Path, data: Dict[str, Any], stream_key: str) -> None:
+    """Write a JSON object, encoding the list under stream_key one item at a time."""
+    if PRETTY_JSON:
+        _write_json(output_file, data)
+        return
+
+    # Only one item is encoded at a time instead of the whole document. The large buffer
+    # batches those small writes into a few syscalls
+    with open(output_file, "wb", buffering=_STREAM_BUFFER_SIZE) as f:
+        f.write(b"{")
+        for index, (key, value) in enumerate(data.items()):
+            if index:
+                f.write(b",")
+            f.write(orjson.dumps(key) + b":")
+            if key != stream_key:
+                f.write(orjson.dumps(value))
+                continue
+            f.write(b"[")
+            for item_index, item in enumerate(value):
+                if item_index:
+                    f.write(b",")
+                f.write(orjson.dumps(item))
+            f.write(b"]")
+        f.write(b"}")
+
+    if GZIP_JSON:
+        _write_gzip(output_file, output_file.read_bytes())
+
+
+def _write_paginated(
+    collection: str,
+    collection_url: str,
+    type_name: str,
+    name: str,
+    description: str,
+    entities: List[Any],
+    make_item: Callable[[Any], Dict[str, Any]],
+    extra_links: Optional[Dict[str, str]] = None,
+    items_per_page: int = 50,
+) -> int:
+    """
+    Write a collection endpoint as pages of items.
+
+    Items are built page by page, so only one page of them is held in memory at a time.
+
+    Args:
+        collection: Directory of the collection under the API root
+        collection_url: Public URL of the collection
+        type_name: JSON-LD type of each page
+        name: Collection name
+        description: Collection description
+        entities: Entities in the collection, in page order
+        make_item: Builds the serialized item, including its links, for one entity
+        extra_links: Links added to every page after its self link
+        items_per_page: Maximum number of items per page
+
+    Returns:
+        Number of pages written
+    """
+    total_items = len(entities)
+    total_pages = (total_items + items_per_page - 1) // items_per_page
+    output_dir = API_DIR / collection
+
+    for page in range(1, total_pages + 1):
+        start_idx = (page - 1) * items_per_page
+
+        # Build links
+        links = {"self": f"{collection_url}?page={page}", **(extra_links or {})}
+        if page > 1:
+            links["first"] = f"{collection_url}?page=1"
+            links["prev"] = f"{collection_url}?page={page - 1}"
+        if page < total_pages:
+            links["next"] = f"{collection_url}?page={page + 1}"
+            links["last"] = f"{collection_url}?page={total_pages}"
+
+        data = {
+            "@context": API_CONTEXT,
+            "@type": type_name,
+            "name": name,
+            "description": description,
+            "totalItems": total_items,
+            "page": page,
+            "perPage": items_per_page,
+            "totalPages": total_pages,
+            "items": [make_item(entity) for entity in entities[start_idx : start_idx + items_per_page]],
+            "_links": links,
+            "generated": _GENERATED_AT,
+        }
+
+        _write_json(output_dir / ("index.json" if page == 1 else f"index_p{page}.json"), data)
+
+    return total_pages
+
 
 def ensure_api_structure() -> None:
     """Ensure API directory structure exists."""
     subdirs = [
         "indicators",
         "tools",
+        "tools/by-indicator",
+        "tools/by-ring",
         "dimensions",
         "relationships",
         "tasks",
@@ -53,196 +642,154 @@ def generate_api_root() -> None:
         "title": "EVERSE Unified API",
         "description": "Unified API for EVERSE research software quality services",
         "endpoints": {
-            "indicators": f"{API_BASE_URL}/indicators/",
-            "tools": f"{API_BASE_URL}/tools/",
-            "dimensions": f"{API_BASE_URL}/dimensions/",
+            "indicators": f"{_INDICATORS_URL}/",
+            "tools": f"{_TOOLS_URL}/",
+            "dimensions": f"{_DIMENSIONS_URL}/",
             "relationships": f"{API_BASE_URL}/relationships/",
             "tasks": f"{API_BASE_URL}/tasks/",
             "pipelines": f"{API_BASE_URL}/pipelines/",
         },
-        "generated": datetime.utcnow().isoformat() + "Z",
+        "generated": _GENERATED_AT,
     }
 
     output_file = API_DIR / "index.json"
-    with open(output_file, "w", encoding="utf-8") as f:
-        json.dump(data, f, indent=2, ensure_ascii=False)
+    _write_json(output_file, data)
 
-    logger.info(f"✓ Generated API root: {output_file}")
+    logger.info("✓ Generated API root: %s", output_file)
 
 
-def generate_indicators_collection(indicators: List[Indicator]) -> None:
+def generate_indicators_collection(
+    indicators: List[Indicator], write_pool: Optional[ThreadPoolExecutor] = None
+) -> None:
     """Generate indicators collection endpoint with pagination."""
     logger.info("Generating indicators collection...")
 
-    # Generate pagination (50 items per page)
-    items_per_page = 50
-    total_items = len(indicators)
-    total_pages = (total_items + items_per_page - 1) // items_per_page
-
-    for page in range(1, total_pages + 1):
-        start_idx = (page - 1) * items_per_page
-        end_idx = min(page * items_per_page, total_items)
-        page_items = indicators[start_idx:end_idx]
-
-        items_data = []
-        for indicator in page_items:
-            item = indicator.model_dump(mode="json")
-            item["_links"] = {
-                "self": f"{API_BASE_URL}/indicators/{indicator.id}",
-                "tools": f"{API_BASE_URL}/tools?indicator={indicator.id}",
-            }
-            items_data.append(item)
-
-        # Build links
-        links = {
-            "self": f"{API_BASE_URL}/indicators?page={page}",
-        }
-        if page > 1:
-            links["first"] = f"{API_BASE_URL}/indicators?page=1"
-            links["prev"] = f"{API_BASE_URL}/indicators?page={page - 1}"
-        if page < total_pages:
-            links["next"] = f"{API_BASE_URL}/indicators?page={page + 1}"
-            links["last"] = f"{API_BASE_URL}/indicators?page={total_pages}"
+    # Every view below reuses one dump per indicator; views copy it before adding their own _links
+    indicator_dicts = _dump_by_id(_INDICATOR_LIST, indicators)
 
-        data = {
-            "@context": API_CONTEXT,
-            "@type": "IndicatorCollection",
-            "name": "Indicators",
-            "description": "Collection of all quality indicators",
-            "totalItems": total_items,
-            "page": page,
-            "perPage": items_per_page,
-            "totalPages": total_pages,
-            "items": items_data,
-            "_links": links,
-            "generated": datetime.utcnow().isoformat() + "Z",
+    def collection_item(indicator: Indicator) -> Dict[str, Any]:
+        item = dict(indicator_dicts[indicator.id])
+        item["_links"] = {
+            "self": f"{_INDICATORS_URL}/{indicator.id}",
+            "tools": f"{_TOOLS_URL}?indicator={indicator.id}",
         }
+        return item
 
-        output_file = API_DIR / "indicators" / f"index_p{page}.json" if page > 1 else API_DIR / "indicators" / "index.json"
-        with open(output_file, "w", encoding="utf-8") as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
+    # Generate pagination (50 items per page)
+    total_pages = _write_paginated(
+        "indicators",
+        _INDICATORS_URL,
+        "IndicatorCollection",
+        "Indicators",
+        "Collection of all quality indicators",
+        indicators,
+        collection_item,
+    )
 
-    logger.info(f"✓ Generated indicators collection ({total_pages} pages)")
+    logger.info("✓ Generated indicators collection (%s pages)", total_pages)
 
     # Generate individual indicator files
+    files = []
     for indicator in indicators:
         # Create safe filename from URL ID (extract last part after slash)
-        safe_filename = indicator.id.split("/")[-1] if "/" in indicator.id else indicator.id
+        safe_filename = indicator.id.rpartition("/")[2]
 
         indicator_data = {
             "@context": API_CONTEXT,
             "@type": "Indicator",
-            **indicator.model_dump(mode="json"),
+            **indicator_dicts[indicator.id],
             "_links": {
-                "self": f"{API_BASE_URL}/indicators/{safe_filename}",
-                "collection": f"{API_BASE_URL}/indicators",
-                "tools": f"{API_BASE_URL}/tools?indicator={indicator.id}",
-                "in-dimensions": f"{API_BASE_URL}/dimensions?indicator={indicator.id}",
+                "self": f"{_INDICATORS_URL}/{safe_filename}",
+                "collection": _INDICATORS_URL,
+                "tools": f"{_TOOLS_URL}?indicator={indicator.id}",
+                "in-dimensions": f"{_DIMENSIONS_URL}?indicator={indicator.id}",
             },
-            "generated": datetime.utcnow().isoformat() + "Z",
+            "generated": _GENERATED_AT,
         }
 
         output_file = API_DIR / "indicators" / f"{safe_filename}.json"
-        with open(output_file, "w", encoding="utf-8") as f:
-            json.dump(indicator_data, f, indent=2, ensure_ascii=False)
+        files.append((output_file, indicator_data))
+
+    _write_json_files(files, write_pool)
 
-    logger.info(f"✓ Generated {len(indicators)} individual indicator files")
+    logger.info("✓ Generated %s individual indicator files", len(indicators))
 
 
-def generate_tools_collection(tools: List[Tool], builder: RelationshipBuilder) -> None:
+def generate_tools_collection(
+    tools: List[Tool], builder: RelationshipBuilder, write_pool: Optional[ThreadPoolExecutor] = None
+) -> None:
     """Generate tools collection endpoint with pagination and filtered views."""
     logger.info("Generating tools collection...")
 
-    # Generate pagination (50 items per page)
-    items_per_page = 50
-    total_items = len(tools)
-    total_pages = (total_items + items_per_page - 1) // items_per_page
+    # Every view below reuses one dump per tool; views copy it before adding their own _links
+    tool_dicts = _dump_by_id(_TOOL_LIST, tools)
 
-    for page in range(1, total_pages + 1):
-        start_idx = (page - 1) * items_per_page
-        end_idx = min(page * items_per_page, total_items)
-        page_items = tools[start_idx:end_idx]
-
-        items_data = []
-        for tool in page_items:
-            item = tool.model_dump(mode="json")
-            item["_links"] = {
-                "self": f"{API_BASE_URL}/tools/{tool.id}",
-                "indicators": f"{API_BASE_URL}/indicators?tool={tool.id}",
-            }
-            items_data.append(item)
-
-        # Build links
-        links = {
-            "self": f"{API_BASE_URL}/tools?page={page}",
-            "by-ring": f"{API_BASE_URL}/tools/by-ring",
+    def collection_item(tool: Tool) -> Dict[str, Any]:
+        item = dict(tool_dicts[tool.id])
+        item["_links"] = {
+            "self": f"{_TOOLS_URL}/{tool.id}",
+            "indicators": f"{_INDICATORS_URL}?tool={tool.id}",
         }
-        if page > 1:
-            links["first"] = f"{API_BASE_URL}/tools?page=1"
-            links["prev"] = f"{API_BASE_URL}/tools?page={page - 1}"
-        if page < total_pages:
-            links["next"] = f"{API_BASE_URL}/tools?page={page + 1}"
-            links["last"] = f"{API_BASE_URL}/tools?page={total_pages}"
+        return item
 
-        data = {
-            "@context": API_CONTEXT,
-            "@type": "ToolCollection",
-            "name": "Tools",
-            "description": "Collection of all quality assessment tools",
-            "totalItems": total_items,
-            "page": page,
-            "perPage": items_per_page,
-            "totalPages": total_pages,
-            "items": items_data,
-            "_links": links,
-            "generated": datetime.utcnow().isoformat() + "Z",
-        }
-
-        output_file = API_DIR / "tools" / f"index_p{page}.json" if page > 1 else API_DIR / "tools" / "index.json"
-        with open(output_file, "w", encoding="utf-8") as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
+    # Generate pagination (50 items per page)
+    total_pages = _write_paginated(
+        "tools",
+        _TOOLS_URL,
+        "ToolCollection",
+        "Tools",
+        "Collection of all quality assessment tools",
+        tools,
+        collection_item,
+        extra_links={"by-ring": f"{_TOOLS_URL}/by-ring"},
+    )
 
-    logger.info(f"✓ Generated tools collection ({total_pages} pages)")
+    logger.info("✓ Generated tools collection (%s pages)", total_pages)
 
     # Generate individual tool files
+    files = []
     for tool in tools:
         # Create safe filename from URL ID (extract last part after slash)
-        safe_filename = tool.id.split("/")[-1] if "/" in tool.id else tool.id
+        safe_filename = tool.id.rpartition("/")[2]
 
         tool_data = {
             "@context": API_CONTEXT,
             "@type": "Tool",
-            **tool.model_dump(mode="json"),
+            **tool_dicts[tool.id],
             "_links": {
-                "self": f"{API_BASE_URL}/tools/{safe_filename}",
-                "collection": f"{API_BASE_URL}/tools",
-                "indicators": f"{API_BASE_URL}/indicators?tool={tool.id}",
+                "self": f"{_TOOLS_URL}/{safe_filename}",
+                "collection": _TOOLS_URL,
+                "indicators": f"{_INDICATORS_URL}?tool={tool.id}",
             },
-            "generated": datetime.utcnow().isoformat() + "Z",
+            "generated": _GENERATED_AT,
         }
 
         output_file = API_DIR / "tools" / f"{safe_filename}.json"
-        with open(output_file, "w", encoding="utf-8") as f:
-            json.dump(tool_data, f, indent=2, ensure_ascii=False)
+        files.append((output_file, tool_data))
 
-    logger.info(f"✓ Generated {len(tools)} individual tool files")
+    _write_json_files(files, write_pool)
 
-    # Generate by-indicator filtered views
-    logger.info("Generating tools by-indicator views...")
-    (API_DIR / "tools" / "by-indicator").mkdir(parents=True, exist_ok=True)
+    logger.info("✓ Generated %s individual tool files", len(tools))
 
+    # Group tools for both filtered views in a single pass
     indicators_to_tools = defaultdict(list)
+    tools_by_ring = defaultdict(list)
     for tool in tools:
-        if hasattr(tool, "related_indicators") and tool.related_indicators:
-            for indicator_id in tool.related_indicators:
-                indicators_to_tools[indicator_id].append(tool)
+        for indicator_id in tool.related_indicators:
+            indicators_to_tools[indicator_id].append(tool)
+        if tool.ring:
+            tools_by_ring[tool.ring].append(tool)
+
+    # Generate by-indicator filtered views
+    logger.info("Generating tools by-indicator views...")
 
+    files = []
     for indicator_id, tools_list in indicators_to_tools.items():
         items_data = []
         for tool in tools_list:
-            item = tool.model_dump(mode="json")
+            item = dict(tool_dicts[tool.id])
             item["_links"] = {
-                "self": f"{API_BASE_URL}/tools/{tool.id}",
+                "self": f"{_TOOLS_URL}/{tool.id}",
             }
             items_data.append(item)
 
@@ -254,34 +801,30 @@ def generate_tools_collection(tools: List[Tool], builder: RelationshipBuilder) -
             "totalItems": len(tools_list),
             "items": items_data,
             "_links": {
-                "self": f"{API_BASE_URL}/tools/by-indicator/{indicator_id}",
-                "collection": f"{API_BASE_URL}/tools",
-                "indicator": f"{API_BASE_URL}/indicators/{indicator_id}",
+                "self": f"{_TOOLS_URL}/by-indicator/{indicator_id}",
+                "collection": _TOOLS_URL,
+                "indicator": f"{_INDICATORS_URL}/{indicator_id}",
             },
-            "generated": datetime.utcnow().isoformat() + "Z",
+            "generated": _GENERATED_AT,
         }
 
         output_file = API_DIR / "tools" / "by-indicator" / f"{indicator_id}.json"
-        with open(output_file, "w", encoding="utf-8") as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
+        files.append((output_file, data))
 
-    logger.info(f"✓ Generated {len(indicators_to_tools)} by-indicator views")
+    _write_json_files(files, write_pool)
+
+    logger.info("✓ Generated %s by-indicator views", len(indicators_to_tools))
 
     # Generate by-ring filtered views
     logger.info("Generating tools by-ring views...")
-    (API_DIR / "tools" / "by-ring").mkdir(parents=True, exist_ok=True)
 
-    tools_by_ring = defaultdict(list)
-    for tool in tools:
-        if hasattr(tool, "ring") and tool.ring:
-            tools_by_ring[tool.ring].append(tool)
-
-    for ring, tools_list in sorted(tools_by_ring.items()):
+    files = []
+    for ring, tools_list in tools_by_ring.items():
         items_data = []
         for tool in tools_list:
-            item = tool.model_dump(mode="json")
+            item = dict(tool_dicts[tool.id])
             item["_links"] = {
-                "self": f"{API_BASE_URL}/tools/{tool.id}",
+                "self": f"{_TOOLS_URL}/{tool.id}",
             }
             items_data.append(item)
 
@@ -293,95 +836,74 @@ def generate_tools_collection(tools: List[Tool], builder: RelationshipBuilder) -
             "totalItems": len(tools_list),
             "items": items_data,
             "_links": {
-                "self": f"{API_BASE_URL}/tools/by-ring/{ring}",
-                "collection": f"{API_BASE_URL}/tools",
+                "self": f"{_TOOLS_URL}/by-ring/{ring}",
+                "collection": _TOOLS_URL,
             },
-            "generated": datetime.utcnow().isoformat() + "Z",
+            "generated": _GENERATED_AT,
         }
 
         output_file = API_DIR / "tools" / "by-ring" / f"{ring}.json"
-        with open(output_file, "w", encoding="utf-8") as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
+        files.append((output_file, data))
+
+    _write_json_files(files, write_pool)
 
-    logger.info(f"✓ Generated {len(tools_by_ring)} by-ring views")
+    logger.info("✓ Generated %s by-ring views", len(tools_by_ring))
 
 
-def generate_dimensions_collection(dimensions: List[Dimension]) -> None:
+def generate_dimensions_collection(
+    dimensions: List[Dimension], write_pool: Optional[ThreadPoolExecutor] = None
+) -> None:
     """Generate dimensions collection endpoint with pagination."""
     logger.info("Generating dimensions collection...")
 
-    # Generate pagination (50 items per page)
-    items_per_page = 50
-    total_items = len(dimensions)
-    total_pages = (total_items + items_per_page - 1) // items_per_page
-
-    for page in range(1, total_pages + 1):
-        start_idx = (page - 1) * items_per_page
-        end_idx = min(page * items_per_page, total_items)
-        page_items = dimensions[start_idx:end_idx]
-
-        items_data = []
-        for dimension in page_items:
-            item = dimension.model_dump(mode="json")
-            item["_links"] = {
-                "self": f"{API_BASE_URL}/dimensions/{dimension.id}",
-                "indicators": f"{API_BASE_URL}/dimensions/{dimension.id}/indicators",
-            }
-            items_data.append(item)
-
-        # Build links
-        links = {
-            "self": f"{API_BASE_URL}/dimensions?page={page}",
-        }
-        if page > 1:
-            links["first"] = f"{API_BASE_URL}/dimensions?page=1"
-            links["prev"] = f"{API_BASE_URL}/dimensions?page={page - 1}"
-        if page < total_pages:
-            links["next"] = f"{API_BASE_URL}/dimensions?page={page + 1}"
-            links["last"] = f"{API_BASE_URL}/dimensions?page={total_pages}"
+    # Every view below reuses one dump per dimension; views copy it before adding their own _links
+    dimension_dicts = _dump_by_id(_DIMENSION_LIST, dimensions)
 
-        data = {
-            "@context": API_CONTEXT,
-            "@type": "DimensionCollection",
-            "name": "Dimensions",
-            "description": "Collection of all quality dimensions",
-            "totalItems": total_items,
-            "page": page,
-            "perPage": items_per_page,
-            "totalPages": total_pages,
-            "items": items_data,
-            "_links": links,
-            "generated": datetime.utcnow().isoformat() + "Z",
+    def collection_item(dimension: Dimension) -> Dict[str, Any]:
+        item = dict(dimension_dicts[dimension.id])
+        item["_links"] = {
+            "self": f"{_DIMENSIONS_URL}/{dimension.id}",
+            "indicators": f"{_DIMENSIONS_URL}/{dimension.id}/indicators",
         }
+        return item
 
-        output_file = API_DIR / "dimensions" / f"index_p{page}.json" if page > 1 else API_DIR / "dimensions" / "index.json"
-        with open(output_file, "w", encoding="utf-8") as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
+    # Generate pagination (50 items per page)
+    total_pages = _write_paginated(
+        "dimensions",
+        _DIMENSIONS_URL,
+        "DimensionCollection",
+        "Dimensions",
+        "Collection of all quality dimensions",
+        dimensions,
+        collection_item,
+    )
 
-    logger.info(f"✓ Generated dimensions collection ({total_pages} pages)")
+    logger.info("✓ Generated dimensions collection (%s pages)", total_pages)
 
     # Generate individual dimension files
+    files = []
     for dimension in dimensions:
         # Create safe filename from URL ID (extract last part after slash)
-        safe_filename = dimension.id.split("/")[-1] if "/" in dimension.id else dimension.id
+        safe_filename = dimension.id.rpartition("/")[2]
 
         dimension_data = {
             "@context": API_CONTEXT,
             "@type": "Dimension",
-            **dimension.model_dump(mode="json"),
+            **dimension_dicts[dimension.id],
             "_links": {
-                "self": f"{API_BASE_URL}/dimensions/{safe_filename}",
-                "collection": f"{API_BASE_URL}/dimensions",
-                "indicators": f"{API_BASE_URL}/dimensions/{dimension.id}/indicators",
+                "self": f"{_DIMENSIONS_URL}/{safe_filename}",
+                "collection": _DIMENSIONS_URL,
+                "indicators": f"{_DIMENSIONS_URL}/{dimension.id}/indicators",
             },
-            "generated": datetime.utcnow().isoformat() + "Z",
+            "generated": _GENERATED_AT,
         }
 
         output_file = API_DIR / "dimensions" / f"{safe_filename}.json"
-        with open(output_file, "w", encoding="utf-8") as f:
-            json.dump(dimension_data, f, indent=2, ensure_ascii=False)
+        files.append((output_file, dimension_data))
+
+    _write_json_files(files, write_pool)
 
-    logger.info(f"✓ Generated {len(dimensions)} individual dimension files")
+    logger.info("✓ Generated %s individual dimension files", len(dimensions))
 
 
 def generate_relationships_graph(builder: RelationshipBuilder) -> None:
@@ -394,14 +916,13 @@ def generate_relationships_graph(builder: RelationshipBuilder) -> None:
         "name": "Entity Relationships",
         "description": "Knowledge graph of relationships between indicators, tools, and dimensions",
         **builder.export_graph(),
-        "generated": datetime.utcnow().isoformat() + "Z",
+        "generated": _GENERATED_AT,
     }
 
     output_file = API_DIR / "relationships" / "graph.json"
-    with open(output_file, "w", encoding="utf-8") as f:
-        json.dump(graph_data, f, indent=2, ensure_ascii=False)
+    _stream_json(output_file, graph_data, "edges")
 
-    logger.info(f"✓ Generated relationships graph: {output_file}")
+    logger.info("✓ Generated relationships graph: %s", output_file)
 
     graph_html = """<!DOCTYPE html>
 <html lang=\"en\">
@@ -594,7 +1115,7 @@ def generate_relationships_graph(builder: RelationshipBuilder) -> None:
     with open(graph_html_file, "w", encoding="utf-8") as f:
         f.write(graph_html)
 
-    logger.info(f"✓ Generated relationship graph visualization: {graph_html_file}")
+    logger.info("✓ Generated relationship graph visualization: %s", graph_html_file)
 
 
 def generate_openapi_spec(
@@ -605,368 +1126,11 @@ def generate_openapi_spec(
     """Generate OpenAPI 3.0 specification."""
     logger.info("Generating OpenAPI specification...")
 
-    spec = {
-        "openapi": "3.0.0",
-        "info": {
-            "title": "EVERSE Unified API",
-            "description": "Unified API for EVERSE research software quality services",
-            "version": API_VERSION,
-            "contact": {
-                "name": "EVERSE Team",
-            },
-            "license": {
-                "name": "Apache 2.0",
-            },
-        },
-        "servers": [
-            {
-                "url": API_BASE_URL,
-                "description": "EVERSE Unified API",
-            }
-        ],
-        "paths": {
-            "/": {
-                "get": {
-                    "operationId": "getApiRoot",
-                    "summary": "API Root",
-                    "description": "Get the API root with links to all endpoints",
-                    "tags": ["Root"],
-                    "responses": {
-                        "200": {
-                            "description": "API root information",
-                            "content": {
-                                "application/json": {
-                                    "schema": {
-                                        "type": "object",
-                                        "properties": {
-                                            "@context": {"type": "string"},
-                                            "@type": {"type": "string"},
-                                            "version": {"type": "string"},
-                                            "endpoints": {"type": "object"},
-                                        },
-                                    }
-                                }
-                            },
-                        }
-                    },
-                }
-            },
-            "/indicators": {
-                "get": {
-                    "operationId": "listIndicators",
-                    "summary": "List Indicators",
-                    "description": "Get paginated list of all quality indicators",
-                    "tags": ["Indicators"],
-                    "parameters": [
-                        {
-                            "name": "page",
-                            "in": "query",
-                            "description": "Page number (default: 1)",
-                            "schema": {"type": "integer", "default": 1},
-                        },
-                        {
-                            "name": "per_page",
-                            "in": "query",
-                            "description": "Items per page (default: 50, max: 100)",
-                            "schema": {"type": "integer", "default": 50},
-                        },
-                    ],
-                    "responses": {
-                        "200": {
-                            "description": "Indicators collection",
-                        }
-                    },
-                }
-            },
-            "/indicators/{id}": {
-                "get": {
-                    "operationId": "getIndicator",
-                    "summary": "Get Indicator",
-                    "description": "Get a specific indicator by ID",
-                    "tags": ["Indicators"],
-                    "parameters": [
-                        {
-                            "name": "id",
-                            "in": "path",
-                            "required": True,
-                            "description": "Indicator ID",
-                            "schema": {"type": "string"},
-                        }
-                    ],
-                    "responses": {
-                        "200": {
-                            "description": "Indicator details",
-                        },
-                        "404": {
-                            "description": "Indicator not found",
-                        },
-                    },
-                }
-            },
-            "/tools": {
-                "get": {
-                    "operationId": "listTools",
-                    "summary": "List Tools",
-                    "description": "Get paginated list of all quality assessment tools",
-                    "tags": ["Tools"],
-                    "parameters": [
-                        {
-                            "name": "page",
-                            "in": "query",
-                            "description": "Page number (default: 1)",
-                            "schema": {"type": "integer", "default": 1},
-                        },
-                        {
-                            "name": "indicator",
-                            "in": "query",
-                            "description": "Filter by indicator ID",
-                            "schema": {"type": "string"},
-                        },
-                        {
-                            "name": "ring",
-                            "in": "query",
-                            "description": "Filter by ring (adopt, trial, assess, hold)",
-                            "schema": {"type": "string"},
-                        },
-                    ],
-                    "responses": {
-                        "200": {
-                            "description": "Tools collection",
-                        }
-                    },
-                }
-            },
-            "/tools/{id}": {
-                "get": {
-                    "operationId": "getTool",
-                    "summary": "Get Tool",
-                    "description": "Get a specific tool by ID",
-                    "tags": ["Tools"],
-                    "parameters": [
-                        {
-                            "name": "id",
-                            "in": "path",
-                            "required": True,
-                            "description": "Tool ID",
-                            "schema": {"type": "string"},
-                        }
-                    ],
-                    "responses": {
-                        "200": {
-                            "description": "Tool details",
-                        },
-                        "404": {
-                            "description": "Tool not found",
-                        },
-                    },
-                }
-            },
-            "/tools/by-indicator/{indicator_id}": {
-                "get": {
-                    "operationId": "getToolsByIndicator",
-                    "summary": "Get Tools by Indicator",
-                    "description": "Get all tools that measure a specific indicator",
-                    "tags": ["Tools"],
-                    "parameters": [
-                        {
-                            "name": "indicator_id",
-                            "in": "path",
-                            "required": True,
-                            "description": "Indicator ID",
-                            "schema": {"type": "string"},
-                        }
-                    ],
-                    "responses": {
-                        "200": {
-                            "description": "Tools for indicator",
-                        },
-                        "404": {
-                            "description": "Indicator not found",
-                        },
-                    },
-                }
-            },
-            "/tools/by-ring/{ring}": {
-                "get": {
-                    "operationId": "getToolsByRing",
-                    "summary": "Get Tools by Ring",
-                    "description": "Get all tools in a specific ring",
-                    "tags": ["Tools"],
-                    "parameters": [
-                        {
-                            "name": "ring",
-                            "in": "path",
-                            "required": True,
-                            "description": "Ring value (adopt, trial, assess, hold)",
-                            "schema": {"type": "string"},
-                        }
-                    ],
-                    "responses": {
-                        "200": {
-                            "description": "Tools by ring",
-                        },
-                        "404": {
-                            "description": "Ring not found",
-                        },
-                    },
-                }
-            },
-            "/dimensions": {
-                "get": {
-                    "operationId": "listDimensions",
-                    "summary": "List Dimensions",
-                    "description": "Get paginated list of all quality dimensions",
-                    "tags": ["Dimensions"],
-                    "parameters": [
-                        {
-                            "name": "page",
-                            "in": "query",
-                            "description": "Page number (default: 1)",
-                            "schema": {"type": "integer", "default": 1},
-                        }
-                    ],
-                    "responses": {
-                        "200": {
-                            "description": "Dimensions collection",
-                        }
-                    },
-                }
-            },
-            "/dimensions/{id}": {
-                "get": {
-                    "operationId": "getDimension",
-                    "summary": "Get Dimension",
-                    "description": "Get a specific dimension by ID",
-                    "tags": ["Dimensions"],
-                    "parameters": [
-                        {
-                            "name": "id",
-                            "in": "path",
-                            "required": True,
-                            "description": "Dimension ID",
-                            "schema": {"type": "string"},
-                        }
-                    ],
-                    "responses": {
-                        "200": {
-                            "description": "Dimension details",
-                        },
-                        "404": {
-                            "description": "Dimension not found",
-                        },
-                    },
-                }
-            },
-            "/dimensions/{id}/indicators": {
-                "get": {
-                    "operationId": "getDimensionIndicators",
-                    "summary": "Get Dimension Indicators",
-                    "description": "Get all indicators for a specific dimension",
-                    "tags": ["Dimensions"],
-                    "parameters": [
-                        {
-                            "name": "id",
-                            "in": "path",
-                            "required": True,
-                            "description": "Dimension ID",
-                            "schema": {"type": "string"},
-                        }
-                    ],
-                    "responses": {
-                        "200": {
-                            "description": "Indicators for dimension",
-                        },
-                        "404": {
-                            "description": "Dimension not found",
-                        },
-                    },
-                }
-            },
-            "/relationships/graph": {
-                "get": {
-                    "operationId": "getRelationshipsGraph",
-                    "summary": "Get Relationships Graph",
-                    "description": "Get the complete knowledge graph of relationships",
-                    "tags": ["Relationships"],
-                    "responses": {
-                        "200": {
-                            "description": "Relationships graph",
-                        }
-                    },
-                }
-            },
-        },
-        "components": {
-            "schemas": {
-                "Indicator": {
-                    "type": "object",
-                    "properties": {
-                        "id": {"type": "string"},
-                        "name": {"type": "string"},
-                        "description": {"type": "string"},
-                        "dimension": {"type": "string"},
-                        "category": {"type": "string"},
-                        "rationale": {"type": "string"},
-                        "url": {"type": "string"},
-                        "_links": {"type": "object"},
-                    },
-                    "required": ["id", "name", "description"],
-                },
-                "Tool": {
-                    "type": "object",
-                    "properties": {
-                        "id": {"type": "string"},
-                        "name": {"type": "string"},
-                        "description": {"type": "string"},
-                        "url": {"type": "string"},
-                        "ring": {"type": "string"},
-                        "quadrant": {"type": "string"},
-                        "_links": {"type": "object"},
-                    },
-                    "required": ["id", "name", "description"],
-                },
-                "Dimension": {
-                    "type": "object",
-                    "properties": {
-                        "id": {"type": "string"},
-                        "name": {"type": "string"},
-                        "description": {"type": "string"},
-                        "indicators": {"type": "array", "items": {"type": "string"}},
-                        "_links": {"type": "object"},
-                    },
-                    "required": ["id", "name", "description"],
-                },
-            }
-        },
-        "tags": [
-            {
-                "name": "Root",
-                "description": "API root endpoint",
-            },
-            {
-                "name": "Indicators",
-                "description": "Quality indicators",
-            },
-            {
-                "name": "Tools",
-                "description": "Quality assessment tools",
-            },
-            {
-                "name": "Dimensions",
-                "description": "Quality dimensions",
-            },
-            {
-                "name": "Relationships",
-                "description": "Entity relationships graph",
-            },
-        ],
-    }
-
     output_file = API_DIR / "openapi.json"
-    with open(output_file, "w", encoding="utf-8") as f:
-        json.dump(spec, f, indent=2, ensure_ascii=False)
+    # The spec is read by people as well as tooling, so it stays indented
+    _write_json(output_file, _OPENAPI_SPEC, pretty=True)
 
-    logger.info(f"✓ Generated OpenAPI specification: {output_file}")
+    logger.info("✓ Generated OpenAPI specification: %s", output_file)
 
 
 @click.command()
@@ -974,10 +1138,9 @@ def generate_openapi_spec(
 @click.option("--verbose", is_flag=True, help="Enable verbose logging")
 def main(skip_cache: bool, verbose: bool) -> None:
     """Generate the EVERSE Unified API."""
-    if verbose:
-        logging.basicConfig(level=logging.DEBUG)
-    else:
-        logging.basicConfig(level=logging.INFO)
+    # scripts.utils configures the root handler on import, so only the level is set here
+    logging.getLogger().setLevel(logging.DEBUG if verbose else logging.INFO)
+    refresh_timestamp()
 
     logger.info("=" * 60)
     logger.info("EVERSE Unified API Generator - Phase 2")
@@ -986,9 +1149,14 @@ def main(skip_cache: bool, verbose: bool) -> None:
     try:
         # Fetch and validate data
         logger.info("\n1. Fetching data from sources...")
-        indicators = fetch_and_validate_indicators(use_cache=not skip_cache)
-        tools = fetch_and_validate_tools(use_cache=not skip_cache)
-        dimensions = fetch_and_validate_dimensions(use_cache=not skip_cache)
+        # The three sources are independent, so fetch them concurrently
+        with ThreadPoolExecutor(max_workers=CONCURRENT_SOURCES) as executor:
+            indicators_future = executor.submit(fetch_and_validate_indicators, use_cache=not skip_cache)
+            tools_future = executor.submit(fetch_and_validate_tools, use_cache=not skip_cache)
+            dimensions_future = executor.submit(fetch_and_validate_dimensions, use_cache=not skip_cache)
+        indicators = indicators_future.result()
+        tools = tools_future.result()
+        dimensions = dimensions_future.result()
 
         if not (indicators and tools and dimensions):
             logger.error("Failed to fetch required data")
@@ -999,8 +1167,7 @@ def main(skip_cache: bool, verbose: bool) -> None:
         is_valid, errors = validate_collections(indicators, tools, dimensions)
         if not is_valid:
             logger.error("Data validation failed")
-            for error in errors:
-                logger.error(f"  - {error}")
+            _log_errors(errors)
             return
 
         # Build relationships
@@ -1013,9 +1180,7 @@ def main(skip_cache: bool, verbose: bool) -> None:
 
         # Validate relationships
         valid_count, errors = builder.validate_relationships()
-        if errors:
-            for error in errors:
-                logger.error(f"  - {error}")
+        _log_errors(errors)
 
         # Save relationships to cache
         builder.save_to_cache()
@@ -1023,46 +1188,55 @@ def main(skip_cache: bool, verbose: bool) -> None:
         # Generate API
         logger.info("\n4. Generating API endpoints with pagination and filtered views...")
         ensure_api_structure()
-        generate_api_root()
-        generate_indicators_collection(indicators)
-        generate_tools_collection(tools, builder)
-        generate_dimensions_collection(dimensions)
-        generate_relationships_graph(builder)
+        _load_content_hashes()
+        # Each generator writes its own set of files, so they can run side by side. They
+        # share one writer pool, which only lives for this step
+        with ThreadPoolExecutor(max_workers=_WRITE_WORKERS, thread_name_prefix="api-writer") as write_pool:
+            _run_concurrently(
+                [
+                    (generate_api_root,),
+                    (generate_indicators_collection, indicators, write_pool),
+                    (generate_tools_collection, tools, builder, write_pool),
+                    (generate_dimensions_collection, dimensions, write_pool),
+                    (generate_relationships_graph, builder),
+                ]
+            )
 
         # Generate OpenAPI specification
         logger.info("\n5. Generating OpenAPI specification...")
         generate_openapi_spec(indicators, tools, dimensions)
+        _save_content_hashes()
 
         # Generate health check endpoints
         logger.info("\n6. Generating health check endpoints...")
-        from scripts.health_check import generate_health_endpoint, generate_status_endpoint, generate_dashboard, generate_landing_page
-
-        generate_health_endpoint()
-        generate_status_endpoint()
+        # These print their progress and take milliseconds, so run them in turn. They share
+        # one timestamp, taken now that the data has been fetched and generated
+        health_generated = datetime.now(timezone.utc)
+        generate_health_endpoint(health_generated)
+        generate_status_endpoint(health_generated)
         generate_dashboard()
-        generate_landing_page()
+        generate_landing_page(health_generated)
 
         # Validate generated API
         logger.info("\n7. Validating generated API...")
         api_valid, api_errors = validate_api_files(API_DIR)
         if not api_valid:
             logger.error("API validation failed")
-            for error in api_errors:
-                logger.error(f"  - {error}")
+            _log_errors(api_errors)
             return
 
         logger.info("\n" + "=" * 60)
         logger.info("✓ API generation completed successfully!")
         logger.info("=" * 60)
-        logger.info(f"API location: {API_DIR}")
-        logger.info(f"Indicators: {len(indicators)}")
-        logger.info(f"Tools: {len(tools)}")
-        logger.info(f"Dimensions: {len(dimensions)}")
-        logger.info(f"Relationships: {valid_count}")
-        logger.info(f"OpenAPI spec: {API_DIR / 'openapi.json'}")
+        logger.info("API location: %s", API_DIR)
+        logger.info("Indicators: %s", len(indicators))
+        logger.info("Tools: %s", len(tools))
+        logger.info("Dimensions: %s", len(dimensions))
+        logger.info("Relationships: %s", valid_count)
+        logger.info("OpenAPI spec: %s", API_DIR / "openapi.json")
 
     except Exception as e:
-        logger.error(f"Fatal error: {e}", exc_info=True)
+        logger.error("Fatal error: %s", e, exc_info=True)
         raise
 
 
@@ -1,10 +1,11 @@
 """Health check and status endpoint generator for EVERSE Unified API."""
 
-import json
 import sys
-from datetime import datetime
+from datetime import datetime, timezone
 from pathlib import Path
-from typing import Dict, Any
+from typing import Dict, Any, Optional
+
+import orjson
 
 # Add parent directory to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
@@ -12,6 +13,11 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 from scripts.config import API_DIR, API_VERSION
 
 
+def _format_timestamp(generated: datetime) -> str:
+    """Format a generation time as an ISO 8601 UTC timestamp."""
+    return generated.strftime("%Y-%m-%dT%H:%M:%S.%fZ")
+
+
 def get_api_stats() -> Dict[str, Any]:
     """Get statistics about the generated API."""
     api_dir = API_DIR
@@ -54,8 +60,9 @@ def get_api_stats() -> Dict[str, Any]:
     return stats
 
 
-def generate_health_endpoint() -> None:
-    """Generate the health check endpoint."""
+def generate_health_endpoint(generated: Optional[datetime] = None) -> None:
+    """Generate the health check endpoint, stamped with generated (default: now)."""
+    timestamp = _format_timestamp(generated or datetime.now(timezone.utc))
     stats = get_api_stats()
 
     health_data = {
@@ -64,7 +71,7 @@ def generate_health_endpoint() -> None:
         "name": "EVERSE Unified API Health",
         "description": "Health status and metrics for the EVERSE Unified API",
         "version": API_VERSION,
-        "timestamp": datetime.utcnow().isoformat() + "Z",
+        "timestamp": timestamp,
         "status": "healthy",
         "components": {
             "api": {
@@ -112,25 +119,25 @@ def generate_health_endpoint() -> None:
 
     # Write health endpoint
     health_file = API_DIR / "health.json"
-    with open(health_file, "w", encoding="utf-8") as f:
-        json.dump(health_data, f, indent=2, ensure_ascii=False)
+    health_file.write_bytes(orjson.dumps(health_data, option=orjson.OPT_INDENT_2))
 
     print(f"✓ Generated health endpoint: {health_file}")
 
 
-def generate_status_endpoint() -> None:
-    """Generate the deployment status endpoint."""
+def generate_status_endpoint(generated: Optional[datetime] = None) -> None:
+    """Generate the deployment status endpoint, stamped with generated (default: now)."""
+    timestamp = _format_timestamp(generated or datetime.now(timezone.utc))
     status_data = {
         "@context": "https://www.w3.org/2019/wot/td/v1",
         "@type": "Status",
         "name": "EVERSE Unified API Status",
         "description": "Current deployment status and information",
         "version": API_VERSION,
-        "timestamp": datetime.utcnow().isoformat() + "Z",
+        "timestamp": timestamp,
         "deployment": {
             "status": "active",
             "environment": "production",
-            "last_update": datetime.utcnow().isoformat() + "Z",
+            "last_update": timestamp,
             "update_frequency": "every 6 hours",
             "update_trigger": "scheduled + manual + push",
         },
@@ -156,8 +163,7 @@ def generate_status_endpoint() -> None:
 
     # Write status endpoint
     status_file = API_DIR / "status.json"
-    with open(status_file, "w", encoding="utf-8") as f:
-        json.dump(status_data, f, indent=2, ensure_ascii=False)
+    status_file.write_bytes(orjson.dumps(status_data, option=orjson.OPT_INDENT_2))
 
     print(f"✓ Generated status endpoint: {status_file}")
 
@@ -518,8 +524,9 @@ def generate_dashboard() -> None:
     print(f"✓ Generated monitoring dashboard: {dashboard_file}")
 
 
-def generate_landing_page() -> None:
-    """Generate the main landing page/index."""
+def generate_landing_page(generated: Optional[datetime] = None) -> None:
+    """Generate the main landing page/index, stamped with generated (default: now)."""
+    generated = generated or datetime.now(timezone.utc)
     stats = get_api_stats()
 
     landing_html = f"""<!DOCTYPE html>
@@ -913,7 +920,7 @@ curl https://vuillaut.github.io/evapi/health.json | jq
             <a href="./relationships/graph.html">Graph Viewer</a>
         </p>
         <p style="margin-top: 10px; font-size: 0.9em;">
-            Last updated: {datetime.utcnow().strftime("%Y-%m-%d %H:%M:%S")} UTC
+            Last updated: {generated.strftime("%Y-%m-%d %H:%M:%S")} UTC
         </p>
     </footer>
 </body>
@@ -929,8 +936,9 @@ curl https://vuillaut.github.io/evapi/health.json | jq
 
 if __name__ == "__main__":
     print("Generating health check and status endpoints...")
-    generate_health_endpoint()
-    generate_status_endpoint()
+    generated = datetime.now(timezone.utc)
+    generate_health_endpoint(generated)
+    generate_status_endpoint(generated)
     generate_dashboard()
-    generate_landing_page()
+    generate_landing_page(generated)
     print("✓ Health check endpoints generated successfully!")
@@ -1,7 +1,13 @@
 """Data models for EVERSE Unified API."""
 
+import sys
 from typing import Any, Dict, List, Optional
-from pydantic import BaseModel, Field, HttpUrl
+from pydantic import BaseModel, Field, HttpUrl, field_validator
+
+
+def _dedupe_ids(ids: List[str]) -> List[str]:
+    """Drop repeated ids while keeping first-seen order, interning each one."""
+    return list(dict.fromkeys(map(sys.intern, ids)))
 
 
 class Indicator(BaseModel):
@@ -19,6 +25,12 @@ class Indicator(BaseModel):
 
     model_config = {"extra": "allow"}  # Allow additional fields from JSON-LD
 
+    @field_validator("related_tools")
+    @classmethod
+    def dedupe_related_tools(cls, value: List[str]) -> List[str]:
+        """Drop repeated tool ids from the source data."""
+        return _dedupe_ids(value)
+
 
 class Tool(BaseModel):
     """Model for a quality assessment tool."""
@@ -35,6 +47,12 @@ class Tool(BaseModel):
     class Config:
         extra = "allow"  # Allow additional fields
 
+    @field_validator("related_indicators")
+    @classmethod
+    def dedupe_related_indicators(cls, value: List[str]) -> List[str]:
+        """Drop repeated indicator ids from the source data."""
+        return _dedupe_ids(value)
+
 
 class Dimension(BaseModel):
     """Model for a quality dimension."""
@@ -48,6 +66,12 @@ class Dimension(BaseModel):
     class Config:
         extra = "allow"
 
+    @field_validator("indicators")
+    @classmethod
+    def dedupe_indicators(cls, value: List[str]) -> List[str]:
+        """Drop repeated indicator ids from the source data."""
+        return _dedupe_ids(value)
+
 
 class Task(BaseModel):
     """Model for an RSQKit task."""
@@ -1,16 +1,32 @@
 """Common utilities for EVERSE Unified API."""
 
+import hashlib
 import json
 import logging
+import mmap
+import tarfile
 import time
-from typing import Any, Dict, List, Optional
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Tuple
 from pathlib import Path
 
+import orjson
 import requests
+from pydantic import TypeAdapter, ValidationError
+from pydantic_core import Url
 from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
 
-from scripts.config import GITHUB_TOKEN, HTTP_TIMEOUT, MAX_RETRIES, RETRY_BACKOFF
+from scripts.config import (
+    FETCH_WORKERS,
+    GITHUB_BRANCH,
+    GITHUB_TOKEN,
+    HTTP_POOL_SIZE,
+    HTTP_TIMEOUT,
+    MAX_RETRIES,
+    RETRY_BACKOFF,
+)
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(name)s - %(levelname)s - %(message)s")
@@ -29,7 +45,8 @@ def get_session_with_retries() -> requests.Session:
         allowed_methods=["GET", "HEAD", "OPTIONS"],
     )
 
-    adapter = HTTPAdapter(max_retries=retry_strategy)
+    # Pool enough connections for the concurrent per-file fetches
+    adapter = HTTPAdapter(pool_connections=HTTP_POOL_SIZE, pool_maxsize=HTTP_POOL_SIZE, max_retries=retry_strategy)
     session.mount("http://", adapter)
     session.mount("https://", adapter)
 
@@ -40,6 +57,56 @@ def get_session_with_retries() -> requests.Session:
     return session
 
 
+GITHUB_GRAPHQL_URL = "https://api.github.com/graphql"
+
+# Lists a directory together with the text of each file in it
+_DIRECTORY_QUERY = """
+query($owner: String!, $name: String!, $expression: String!) {
+  repository(owner: $owner, name: $name) {
+    object(expression: $expression) {
+      ... on Tree {
+        entries {
+          name
+          type
+          oid
+          object {
+            ... on Blob {
+              text
+              isTruncated
+            }
+          }
+        }
+      }
+    }
+  }
+}
+"""
+
+# Shared keep-alive session so repeated requests reuse pooled connections instead of
+# paying a TCP and TLS handshake each time
+SESSION = get_session_with_retries()
+
+
+def fetch_bytes(url: str, timeout: int = HTTP_TIMEOUT) -> Optional[bytes]:
+    """
+    Fetch the raw body of a URL with retry logic.
+
+    Args:
+        url: URL to fetch
+        timeout: Request timeout in seconds
+
+    Returns:
+        Response body or None if fetch fails
+    """
+    try:
+        response = SESSION.get(url, timeout=timeout)
+        response.raise_for_status()
+        return response.content
+    except requests.exceptions.RequestException as e:
+        logger.error(f"Failed to fetch {url}: {e}")
+        return None
+
+
 def fetch_json(url: str, timeout: int = HTTP_TIMEOUT) -> Optional[Dict[str, Any]]:
     """
     Fetch JSON data from a URL with retry logic.
@@ -51,17 +118,43 @@ def fetch_json(url: str, timeout: int = HTTP_TIMEOUT) -> Optional[Dict[str, Any]
     Returns:
         Parsed JSON data or None if fetch fails
     """
-    session = get_session_with_retries()
+    content = fetch_bytes(url, timeout)
+    if content is None:
+        return None
+
+    try:
+        return orjson.loads(content)
+    except orjson.JSONDecodeError as e:
+        logger.error(f"Failed to parse JSON from {url}: {e}")
+        return None
+
+
+def fetch_bytes_with_etag(
+    url: str, etag: Optional[str] = None, timeout: int = HTTP_TIMEOUT
+) -> Tuple[int, Optional[str], Optional[bytes]]:
+    """
+    Fetch the raw body of a URL, revalidating a previously seen ETag.
+
+    Args:
+        url: URL to fetch
+        etag: ETag from an earlier response, sent as If-None-Match
+        timeout: Request timeout in seconds
+
+    Returns:
+        Tuple of (status code, ETag, response body). A 304 status means the
+        content is unchanged and no body is returned; status 0 means the fetch failed.
+    """
+    headers = {"If-None-Match": etag} if etag else None
 
     try:
-        response = session.get(url, timeout=timeout)
+        response = SESSION.get(url, timeout=timeout, headers=headers)
+        if response.status_code == 304:
+            return 304, etag, None
         response.raise_for_status()
-        return response.json()
+        return response.status_code, response.headers.get("ETag"), response.content
     except requests.exceptions.RequestException as e:
         logger.error(f"Failed to fetch {url}: {e}")
-        return None
-    finally:
-        session.close()
+        return 0, None, None
 
 
 import json
@@ -107,6 +200,19 @@ def convert_httpurl_to_str(obj):
         return obj
 
 
+def _orjson_default(obj: Any) -> Any:
+    """Serialize Pydantic models and URLs, which orjson does not handle natively."""
+    # Handle Pydantic models
+    if hasattr(obj, "model_dump"):
+        return obj.model_dump(mode="json", exclude={"metadata"})
+
+    # Handle HttpUrl objects
+    if isinstance(obj, Url):
+        return str(obj)
+
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
 def save_json(data, filepath: Path) -> None:
     """
     Save data to a JSON file.
@@ -117,11 +223,9 @@ def save_json(data, filepath: Path) -> None:
     """
     filepath.parent.mkdir(parents=True, exist_ok=True)
 
-    # Recursively convert any HttpUrl objects and Pydantic models to serializable format
-    data = convert_httpurl_to_str(data)
-
-    with open(filepath, "w", encoding="utf-8") as f:
-        json.dump(data, f, indent=2, ensure_ascii=False)
+    # orjson encodes in one pass, converting Pydantic models and HttpUrl values through the default hook
+    options = orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+    filepath.write_bytes(orjson.dumps(data, default=_orjson_default, option=options))
 
     logger.info(f"Saved JSON to {filepath}")
 
@@ -141,13 +245,113 @@ def load_json(filepath: Path) -> Optional[Dict[str, Any]]:
         return None
 
     try:
-        with open(filepath, "r", encoding="utf-8") as f:
-            return json.load(f)
-    except json.JSONDecodeError as e:
+        # Parse straight from the mapped file instead of reading it into a bytes copy first
+        with open(filepath, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm, memoryview(mm) as view:
+            return orjson.loads(view)
+    except ValueError as e:
+        # Raised for malformed JSON and for empty files, which can't be mapped
         logger.error(f"Failed to parse JSON from {filepath}: {e}")
         return None
 
 
+def validate_batch(adapter: TypeAdapter, records: List[Dict[str, Any]], label: str) -> Tuple[List[Any], List[str]]:
+    """
+    Validate records with a single pydantic-core call, dropping the ones that fail.
+
+    Args:
+        adapter: TypeAdapter for a list of the target model
+        records: Raw records to validate
+        label: Name of the entity kind, used in error messages
+
+    Returns:
+        Tuple of (validated models in input order, error messages for dropped records)
+    """
+    try:
+        return adapter.validate_python(records), []
+    except ValidationError as e:
+        # Error locations start with the index of the offending record
+        failures: Dict[int, List[str]] = defaultdict(list)
+        for error in e.errors():
+            field = ".".join(str(part) for part in error["loc"][1:])
+            failures[error["loc"][0]].append(f"{field}: {error['msg']}")
+
+    errors = [
+        f"Validation error for {label} {records[index].get('id', 'unknown')}: {'; '.join(messages)}"
+        for index, messages in failures.items()
+    ]
+    valid = [record for index, record in enumerate(records) if index not in failures]
+    return adapter.validate_python(valid), errors
+
+
+def drop_duplicate_ids(records: List[Dict[str, Any]], label: str) -> List[Dict[str, Any]]:
+    """
+    Keep the first record for each id.
+
+    Mirrored or renamed upstream files can carry the same id.
+
+    Args:
+        records: Raw records, each with an "id"
+        label: Name of the entity kind, used in log messages
+
+    Returns:
+        Records with unique ids, in input order
+    """
+    seen_ids = set()
+    unique = []
+    for record in records:
+        if record["id"] not in seen_ids:
+            seen_ids.add(record["id"])
+            unique.append(record)
+
+    if len(unique) < len(records):
+        logger.warning(f"Skipped {len(records) - len(unique)} {label}s with duplicate ids")
+    return unique
+
+
+def memoized_fetch(
+    load_cache: Callable[[], Optional[List[Any]]], fetch: Callable[[], List[Any]], label: str
+) -> Callable[[bool], List[Any]]:
+    """
+    Build the loader behind a fetch_and_validate_* function, memoized for the process.
+
+    With use_cache, the first call loads the cache file (fetching if it is unusable)
+    and later calls reuse that result; empty results are not kept. Without it, the
+    source is always fetched and the memoized result is dropped. The loader has a
+    cache_clear() method.
+
+    Every call returns a new list, but the models in it are shared between callers,
+    so copy a model before modifying it.
+
+    Args:
+        load_cache: Loads the validated entities from the cache file, or returns None
+        fetch: Fetches and validates the entities and refreshes the cache file
+        label: Plural name of the entity kind, used in log messages
+
+    Returns:
+        Function taking use_cache and returning the entities
+    """
+    memo: List[List[Any]] = []
+
+    def load(use_cache: bool = True) -> List[Any]:
+        if not use_cache:
+            memo.clear()
+            return fetch()
+
+        if not memo:
+            entities = load_cache()
+            if entities:
+                logger.info(f"Loaded {len(entities)} {label} from cache")
+            else:
+                entities = fetch()
+            if not entities:
+                return []
+            memo.append(entities)
+        return list(memo[0])
+
+    load.cache_clear = memo.clear
+    return load
+
+
 def list_github_files(owner: str, repo: str, path: str = "") -> List[Dict[str, Any]]:
     """
     List files in a GitHub repository directory.
@@ -158,24 +362,259 @@ def list_github_files(owner: str, repo: str, path: str = "") -> List[Dict[str, A
         path: Path within the repository
 
     Returns:
-        List of file information dictionaries
+        List of file information dictionaries, or an empty list if any page fails
     """
     url = f"https://api.github.com/repos/{owner}/{repo}/contents/{path}"
+    # Ask for the largest page size so long listings take as few round trips as possible
+    params: Optional[Dict[str, Any]] = {"per_page": 100}
+    files = []
 
-    session = get_session_with_retries()
+    try:
+        while url:
+            response = SESSION.get(
+                url, params=params, timeout=HTTP_TIMEOUT, headers={"Accept": "application/vnd.github+json"}
+            )
+            response.raise_for_status()
+            files.extend(response.json())
+            # The next-page link already carries the query parameters
+            url = response.links.get("next", {}).get("url")
+            params = None
+    except requests.exceptions.RequestException as e:
+        logger.error(f"Failed to list GitHub files from {url}: {e}")
+        return []
+
+    return files
+
+
+def get_github_tree(owner: str, repo: str, ref: str = GITHUB_BRANCH) -> Optional[Dict[str, Any]]:
+    """
+    Get the recursive git tree of a GitHub repository in one request.
+
+    Args:
+        owner: Repository owner
+        repo: Repository name
+        ref: Branch, tag or commit to read the tree from
+
+    Returns:
+        Tree data with its SHA and entries, or None if the request fails
+    """
+    url = f"https://api.github.com/repos/{owner}/{repo}/git/trees/{ref}?recursive=1"
 
     try:
-        response = session.get(url, timeout=HTTP_TIMEOUT)
+        response = SESSION.get(url, timeout=HTTP_TIMEOUT, headers={"Accept": "application/vnd.github+json"})
         response.raise_for_status()
         return response.json()
     except requests.exceptions.RequestException as e:
-        logger.error(f"Failed to list GitHub files from {url}: {e}")
-        return []
-    finally:
-        session.close()
+        logger.error(f"Failed to get GitHub tree from {url}: {e}")
+        return None
+
+
+def fetch_directory_json(
+    owner: str, repo: str, path: str, ref: str = GITHUB_BRANCH
+) -> Optional[Dict[str, Dict[str, Any]]]:
+    """
+    Fetch every JSON file in a GitHub repository directory with one GraphQL query.
+
+    Requires a GitHub token, since the GraphQL API does not accept anonymous requests.
+
+    Args:
+        owner: Repository owner
+        repo: Repository name
+        path: Directory path within the repository
+        ref: Branch, tag or commit to read the directory from
+
+    Returns:
+        Mapping of repository path to {"sha": blob SHA, "data": parsed JSON} for the
+        directory's JSON files in name order, or None if the query is unavailable or fails
+    """
+    if not GITHUB_TOKEN:
+        return None
+
+    variables = {"owner": owner, "name": repo, "expression": f"{ref}:{path}"}
+
+    try:
+        response = SESSION.post(
+            GITHUB_GRAPHQL_URL, json={"query": _DIRECTORY_QUERY, "variables": variables}, timeout=HTTP_TIMEOUT
+        )
+        response.raise_for_status()
+        result = response.json()
+    except requests.exceptions.RequestException as e:
+        logger.error(f"Failed to query GitHub directory {owner}/{repo}/{path}: {e}")
+        return None
+
+    tree = ((result.get("data") or {}).get("repository") or {}).get("object")
+    if result.get("errors") or not tree:
+        logger.error(f"GitHub GraphQL query for {owner}/{repo}/{path} failed: {result.get('errors')}")
+        return None
+
+    files = {}
+    for entry in tree.get("entries", []):
+        name = entry.get("name", "")
+        blob = entry.get("object") or {}
+        if entry.get("type") != "blob" or not name.endswith(".json"):
+            continue
+        file_path = f"{path}/{name}"
+        if blob.get("isTruncated") or blob.get("text") is None:
+            # GraphQL truncates large blobs, so read those from the raw file instead
+            content = fetch_bytes(get_raw_github_url(owner, repo, file_path, ref))
+            if content is None:
+                logger.warning(f"Skipping {name}: contents not returned by GraphQL or the raw file")
+                continue
+        else:
+            content = blob["text"]
+        try:
+            files[file_path] = {"sha": entry.get("oid"), "data": orjson.loads(content)}
+        except orjson.JSONDecodeError as e:
+            logger.warning(f"Failed to parse {name}: {e}")
+
+    return files
+
+
+def fetch_directory_tarball(
+    owner: str, repo: str, path: str, branch: str = GITHUB_BRANCH
+) -> Optional[Dict[str, Dict[str, Any]]]:
+    """
+    Fetch every JSON file in a GitHub repository directory from the branch tarball.
 
+    The whole repository arrives in a single streamed response and only the
+    directory's JSON files are parsed.
+
+    Args:
+        owner: Repository owner
+        repo: Repository name
+        path: Directory path within the repository
+        branch: Branch name
+
+    Returns:
+        Mapping of repository path to {"sha": blob SHA, "data": parsed JSON} for the
+        directory's JSON files in name order, or None if the download fails
+    """
+    url = f"https://codeload.github.com/{owner}/{repo}/tar.gz/refs/heads/{branch}"
+    prefix = f"{path.strip('/')}/"
+    files = {}
+
+    try:
+        with SESSION.get(url, timeout=HTTP_TIMEOUT, stream=True) as response:
+            response.raise_for_status()
+            with tarfile.open(fileobj=response.raw, mode="r|gz") as archive:
+                for member in archive:
+                    # Members are stored under a "<repo>-<branch>/" top-level directory
+                    relative = member.name.partition("/")[2]
+                    name = relative[len(prefix) :]
+                    if not member.isfile() or not relative.startswith(prefix) or "/" in name:
+                        continue
+                    if not name.endswith(".json"):
+                        continue
+                    content = archive.extractfile(member).read()
+                    try:
+                        files[relative] = {"sha": git_blob_sha(content), "data": orjson.loads(content)}
+                    except orjson.JSONDecodeError as e:
+                        logger.warning(f"Failed to parse {name}: {e}")
+    except (requests.exceptions.RequestException, tarfile.TarError) as e:
+        logger.error(f"Failed to fetch GitHub tarball from {url}: {e}")
+        return None
+
+    # Match the name ordering of the contents listing
+    return {file_path: files[file_path] for file_path in sorted(files)}
+
+
+def git_blob_sha(content: bytes) -> str:
+    """
+    Compute the git blob SHA of file contents, as reported by the GitHub APIs.
+
+    Args:
+        content: Raw file bytes
+
+    Returns:
+        Hex SHA-1 of the git blob object
+    """
+    return hashlib.sha1(b"blob %d\0" % len(content) + content).hexdigest()
+
+
+def fetch_github_json_files(
+    owner: str, repo: str, path: str, cache_file: Path, label: str = "file"
+) -> List[Dict[str, Any]]:
+    """
+    Fetch every JSON file in a GitHub repository directory, updating a per-file cache.
+
+    Without a cache the directory is downloaded in one request (GraphQL with a
+    token, otherwise the branch tarball). Once the cache exists the directory is
+    listed and only files whose blob SHA changed are downloaded, revalidated with
+    their ETag, so an unchanged directory costs a single listing request.
+
+    Args:
+        owner: Repository owner
+        repo: Repository name
+        path: Directory path within the repository
+        cache_file: Per-file cache of {path: {"sha", "etag", "data"}}
+        label: Name of the entity kind, used in log messages
+
+    Returns:
+        List of parsed JSON files in listing order
+    """
+    cached_files = (load_json(cache_file) if cache_file.exists() else None) or {}
+
+    if not cached_files:
+        files = fetch_directory_json(owner, repo, path)
+        if files is None:
+            files = fetch_directory_tarball(owner, repo, path)
+        if files is not None:
+            save_json(files, cache_file)
+            return [entry["data"] for entry in files.values()]
+
+    listing = list_github_files(owner, repo, path)
+
+    if not listing:
+        logger.error(f"Failed to list {label} files from GitHub")
+        return []
 
-def get_raw_github_url(owner: str, repo: str, path: str, branch: str = "main") -> str:
+    # Empty files have nothing to parse, so they aren't downloaded
+    json_files = [
+        file_info for file_info in listing if file_info["name"].endswith(".json") and file_info.get("size") != 0
+    ]
+
+    def fetch_file(file_info: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        file_path = file_info.get("path", "")
+        sha = file_info.get("sha")
+        cached = cached_files.get(file_path)
+        if cached and sha and cached.get("sha") == sha:
+            return cached
+
+        url = get_raw_github_url(owner, repo, file_path)
+
+        logger.info(f"Fetching {label}: {file_info['name']}")
+        # Unchanged files come back as 304 without a body and don't count against the rate limit
+        status, etag, content = fetch_bytes_with_etag(url, cached.get("etag") if cached else None)
+        if status == 304:
+            return {**cached, "sha": sha}
+        return {"sha": sha, "etag": etag, "content": content} if content else None
+
+    results = []
+    fetched_files = {}
+
+    with ThreadPoolExecutor(max_workers=FETCH_WORKERS) as executor:
+        # map() keeps results in listing order, so the output stays deterministic. The
+        # workers only download; bodies are parsed here while later downloads are in flight
+        for file_info, entry in zip(json_files, executor.map(fetch_file, json_files)):
+            if entry and "content" in entry:
+                content = entry.pop("content")
+                try:
+                    entry["data"] = orjson.loads(content)
+                except orjson.JSONDecodeError as e:
+                    logger.warning(f"Failed to parse {file_info['name']}: {e}")
+                    entry = None
+            if entry and entry["data"]:
+                results.append(entry["data"])
+                fetched_files[file_info["path"]] = entry
+            else:
+                logger.warning(f"Failed to fetch {file_info['name']}")
+
+    # Files removed upstream are not carried over
+    save_json(fetched_files, cache_file)
+    return results
+
+
+def get_raw_github_url(owner: str, repo: str, path: str, branch: str = GITHUB_BRANCH) -> str:
     """
     Get raw GitHub URL for a file.
 
@@ -4,11 +4,13 @@ import logging
 from pathlib import Path
 from typing import List, Tuple
 
-from jsonschema import validate, ValidationError
 from scripts.models import Indicator, Tool, Dimension
 
 logger = logging.getLogger(__name__)
 
+# Radar rings a tool may be placed in
+_VALID_RINGS = frozenset({"adopt", "trial", "assess", "hold"})
+
 
 def validate_indicator(indicator: Indicator) -> Tuple[bool, List[str]]:
     """
@@ -59,8 +61,7 @@ def validate_tool(tool: Tool) -> Tuple[bool, List[str]]:
 
     # Check ring value
     if tool.ring:
-        valid_rings = {"adopt", "trial", "assess", "hold"}
-        if tool.ring.lower() not in valid_rings:
+        if tool.ring.lower() not in _VALID_RINGS:
             errors.append(f"Tool has invalid ring: {tool.ring}")
 
     return len(errors) == 0, errors
@@ -106,21 +107,15 @@ def validate_collections(
     errors = []
     logger.info("Validating entity collections...")
 
-    # Validate individual items
-    for indicator in indicators:
-        valid, ind_errors = validate_indicator(indicator)
-        if not valid:
-            errors.extend(ind_errors)
-
-    for tool in tools:
-        valid, tool_errors = validate_tool(tool)
-        if not valid:
-            errors.extend(tool_errors)
-
-    for dimension in dimensions:
-        valid, dim_errors = validate_dimension(dimension)
-        if not valid:
-            errors.extend(dim_errors)
+    # Validate individual items; entities were already validated against their
+    # models at fetch time, so only the field-level checks run here
+    for validator, entities in (
+        (validate_indicator, indicators),
+        (validate_tool, tools),
+        (validate_dimension, dimensions),
+    ):
+        for entity in entities:
+            errors.extend(validator(entity)[1])
 
     logger.info(f"Validated {len(indicators)} indicators, {len(tools)} tools, {len(dimensions)} dimensions")
 
@@ -0,0 +1,119 @@
+"""Tests for the relationship builder."""
+
+import json
+
+import pytest
+
+import scripts.build_relationships as build_relationships
+from scripts.build_relationships import RelationshipBuilder
+from scripts.models import Indicator, Tool, Dimension
+
+
+@pytest.fixture
+def builder():
+    """Create a relationship builder with in-memory test data."""
+    builder = RelationshipBuilder()
+    builder.add_indicators(
+        [
+            Indicator(id="license", name="License", dimension="legal", related_tools=["howfairis"]),
+            Indicator(id="citation", name="Citation", dimension="legal", related_tools=["howfairis", "zenodo"]),
+        ]
+    )
+    builder.add_tools(
+        [
+            Tool(id="howfairis", name="howfairis", ring="adopt", related_indicators=["license", "citation"]),
+            Tool(id="zenodo", name="Zenodo", ring="adopt", related_indicators=["citation"]),
+        ]
+    )
+    builder.add_dimensions([Dimension(id="legal", name="Legal", indicators=["license", "citation"])])
+    builder.build_all_relationships()
+    return builder
+
+
+class TestRelationshipQueries:
+    """Tests for relationship lookups."""
+
+    def test_get_tools_for_indicator(self, builder):
+        """Test getting tools that measure an indicator."""
+        tool_ids = {tool.id for tool in builder.get_tools_for_indicator("citation")}
+        assert tool_ids == {"howfairis", "zenodo"}
+
+    def test_get_indicators_for_tool(self, builder):
+        """Test getting indicators measured by a tool."""
+        indicator_ids = {ind.id for ind in builder.get_indicators_for_tool("howfairis")}
+        assert indicator_ids == {"license", "citation"}
+
+    def test_get_indicators_for_dimension(self, builder):
+        """Test getting indicators in a dimension."""
+        indicator_ids = {ind.id for ind in builder.get_indicators_for_dimension("legal")}
+        assert indicator_ids == {"license", "citation"}
+
+    def test_unknown_ids_return_empty(self, builder):
+        """Test lookups for unknown entities."""
+        assert builder.get_tools_for_indicator("unknown") == []
+        assert builder.get_indicators_for_tool("unknown") == []
+        assert builder.get_indicators_for_dimension("unknown") == []
+
+
+class TestRelationshipBuilding:
+    """Tests for edge construction."""
+
+    def test_duplicate_references_create_single_edge(self):
+        """Test that repeated references in source data are deduplicated."""
+        builder = RelationshipBuilder()
+        builder.add_indicators([Indicator(id="license", name="License")])
+        builder.add_tools([Tool(id="reuse", name="REUSE", related_indicators=["license", "license"])])
+        builder.build_tool_to_indicator_relationships()
+
+        assert len(builder.relationships) == 1
+        assert [tool.id for tool in builder.get_tools_for_indicator("license")] == ["reuse"]
+
+    def test_validate_relationships_reports_dangling_edges(self, builder):
+        """Test that edges pointing at removed entities are reported."""
+        valid_count, errors = builder.validate_relationships()
+        assert valid_count == len(builder.relationships)
+        assert errors == []
+
+        del builder.tools["zenodo"]
+        valid_count, errors = builder.validate_relationships()
+        assert valid_count == len(builder.relationships) - 2
+        assert "Relationship references unknown tool zenodo" in errors
+
+    def test_export_graph(self, builder):
+        """Test graph export contents."""
+        graph = builder.export_graph()
+        assert set(graph["nodes"]["indicators"]) == {"license", "citation"}
+        assert graph["nodes"]["tools"]["zenodo"]["ring"] == "adopt"
+        assert len(graph["edges"]) == len(builder.relationships)
+        assert graph["statistics"]["total_relationships"] == len(builder.relationships)
+        assert builder.export_graph() == graph
+
+    def test_save_to_cache(self, builder, tmp_path, monkeypatch):
+        """Test that the streamed cache file is valid JSON."""
+        monkeypatch.setattr(build_relationships, "_RELATIONSHIPS_CACHE", tmp_path / "relationships.json")
+        cache_file = builder.save_to_cache()
+        assert cache_file == tmp_path / "relationships.json"
+        with open(cache_file) as f:
+            data = json.load(f)
+
+        assert data["type"] == "RelationshipGraph"
+        assert data["edge_count"] == len(data["edges"]) == builder.edge_count
+        assert data["edges"] == builder.export_graph()["edges"]
+        assert data["node_counts"] == {"indicators": 2, "tools": 2, "dimensions": 1}
+
+    def test_queries_build_relationships_on_demand(self):
+        """Test that getters build the relationship type they need."""
+        builder = RelationshipBuilder()
+        builder.add_indicators([Indicator(id="license", name="License")])
+        builder.add_tools([Tool(id="reuse", name="REUSE", related_indicators=["license"])])
+
+        assert [tool.id for tool in builder.get_tools_for_indicator("license")] == ["reuse"]
+        assert builder.edge_count == 1
+
+    def test_adding_entities_resets_relationships(self, builder):
+        """Test that relationships are rebuilt after new entities are added."""
+        builder.add_tools([Tool(id="reuse", name="REUSE", related_indicators=["license"])])
+        assert builder.edge_count == 0
+
+        tool_ids = {tool.id for tool in builder.get_tools_for_indicator("license")}
+        assert tool_ids == {"howfairis", "reuse"}
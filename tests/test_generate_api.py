@@ -0,0 +1,95 @@
+"""Tests for the content-hash write gate in generate_api."""
+
+import gzip
+import json
+
+import pytest
+
+import scripts.generate_api as generate_api
+
+
+@pytest.fixture
+def api_dir(tmp_path, monkeypatch):
+    """Point the writer at a temporary API tree with an empty hash table."""
+    api_dir = tmp_path / "api"
+    api_dir.mkdir()
+    monkeypatch.setattr(generate_api, "API_DIR", api_dir)
+    monkeypatch.setattr(generate_api, "_HASHES_FILE", tmp_path / "cache" / "api_hashes.json")
+    monkeypatch.setattr(generate_api, "_content_hashes", {})
+    monkeypatch.setattr(generate_api, "GZIP_JSON", False)
+    (tmp_path / "cache").mkdir()
+    return api_dir
+
+
+def _next_run():
+    """Persist the hashes and reload them as a fresh run would."""
+    generate_api._save_content_hashes()
+    generate_api._content_hashes.clear()
+    generate_api._load_content_hashes()
+
+
+class TestContentHashGate:
+    """Tests for skipping unchanged endpoint files."""
+
+    def test_hashes_are_kept_outside_the_api_tree(self):
+        """Test that the hash sidecar is not written into the published directory."""
+        assert generate_api.API_DIR not in generate_api._HASHES_FILE.parents
+
+    def test_unchanged_file_is_not_rewritten(self, api_dir):
+        """Test that only the timestamp changing leaves the previous file in place."""
+        output_file = api_dir / "item.json"
+        generate_api._write_json(output_file, {"name": "License", "generated": "run-1"})
+        _next_run()
+
+        generate_api._write_json(output_file, {"name": "License", "generated": "run-2"})
+        assert json.loads(output_file.read_bytes())["generated"] == "run-1"
+
+    def test_changed_file_is_rewritten(self, api_dir):
+        """Test that a content change is written out."""
+        output_file = api_dir / "item.json"
+        generate_api._write_json(output_file, {"name": "License", "generated": "run-1"})
+        _next_run()
+
+        generate_api._write_json(output_file, {"name": "Licence", "generated": "run-2"})
+        assert json.loads(output_file.read_bytes()) == {"name": "Licence", "generated": "run-2"}
+
+    def test_missing_file_is_rewritten(self, api_dir):
+        """Test that a recorded hash does not stand in for a deleted file."""
+        output_file = api_dir / "item.json"
+        generate_api._write_json(output_file, {"name": "License", "generated": "run-1"})
+        _next_run()
+        output_file.unlink()
+
+        generate_api._write_json(output_file, {"name": "License", "generated": "run-2"})
+        assert json.loads(output_file.read_bytes())["generated"] == "run-2"
+
+    def test_pretty_toggle_rewrites(self, api_dir):
+        """Test that switching to indented output rewrites an unchanged file."""
+        output_file = api_dir / "item.json"
+        generate_api._write_json(output_file, {"name": "License", "generated": "run-1"}, pretty=False)
+        _next_run()
+
+        generate_api._write_json(output_file, {"name": "License", "generated": "run-2"}, pretty=True)
+        assert output_file.read_bytes().startswith(b"{\n  ")
+
+    def test_gzip_toggle_rewrites(self, api_dir, monkeypatch):
+        """Test that enabling gzip writes the compressed copy of an unchanged file."""
+        output_file = api_dir / "item.json"
+        generate_api._write_json(output_file, {"name": "License", "generated": "run-1"})
+        _next_run()
+
+        monkeypatch.setattr(generate_api, "GZIP_JSON", True)
+        generate_api._write_json(output_file, {"name": "License", "generated": "run-2"})
+        gzip_file = api_dir / "item.json.gz"
+        assert gzip.decompress(gzip_file.read_bytes()) == output_file.read_bytes()
+        assert json.loads(output_file.read_bytes())["generated"] == "run-2"
+
+
+def test_refresh_timestamp_stamps_later_files(api_dir, monkeypatch):
+    """Test that files written after a refresh carry the new run timestamp."""
+    monkeypatch.setattr(generate_api, "_GENERATED_AT", "import-time")
+    monkeypatch.setattr(generate_api, "_utc_timestamp", lambda: "run-time")
+
+    generate_api.refresh_timestamp()
+    generate_api.generate_api_root()
+    assert json.loads((api_dir / "index.json").read_bytes())["generated"] == "run-time"
@@ -0,0 +1,20 @@
+"""Tests for the health and status endpoint generators."""
+
+import json
+from datetime import datetime, timezone
+
+import scripts.health_check as health_check
+
+
+def test_status_endpoint_uses_call_time(tmp_path, monkeypatch):
+    """Test that the status endpoint is stamped when it is generated, not when the module was imported."""
+    monkeypatch.setattr(health_check, "API_DIR", tmp_path)
+
+    generated = datetime(2030, 1, 2, 3, 4, 5, tzinfo=timezone.utc)
+    health_check.generate_status_endpoint(generated)
+    status = json.loads((tmp_path / "status.json").read_bytes())
+    assert status["timestamp"] == status["deployment"]["last_update"] == "2030-01-02T03:04:05.000000Z"
+
+    before = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%S")
+    health_check.generate_status_endpoint()
+    assert json.loads((tmp_path / "status.json").read_bytes())["timestamp"] >= before
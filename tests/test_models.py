@@ -46,6 +46,15 @@ class TestTool:
         )
         assert len(tool.related_indicators) == 2
 
+    def test_tool_related_indicators_deduplicated(self):
+        """Test that repeated indicator references are dropped in order."""
+        tool = Tool(
+            id="test-tool",
+            name="Test Tool",
+            related_indicators=["indicator2", "indicator1", "indicator2"],
+        )
+        assert tool.related_indicators == ["indicator2", "indicator1"]
+
 
 class TestDimension:
     """Tests for Dimension model."""
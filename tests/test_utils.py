@@ -0,0 +1,275 @@
+"""Offline tests for the GitHub fetch helpers and data caches; the HTTP session is replaced by a fake."""
+
+import io
+import tarfile
+
+import orjson
+import pytest
+import requests
+
+import scripts.fetch_dimensions as fetch_dimensions
+import scripts.fetch_tools as fetch_tools
+import scripts.utils as utils
+from scripts.models import Dimension, Tool
+
+OWNER, REPO, PATH = "owner", "repo", "data"
+LISTING_URL = f"https://api.github.com/repos/{OWNER}/{REPO}/contents/{PATH}"
+
+
+class FakeResponse:
+    """Minimal stand-in for requests.Response."""
+
+    def __init__(self, status_code=200, content=b"", headers=None, json_data=None, links=None):
+        self.status_code = status_code
+        self.content = content
+        self.headers = headers or {}
+        self.links = links or {}
+        self._json_data = json_data
+        self.raw = io.BytesIO(content)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+    def json(self):
+        return self._json_data if self._json_data is not None else orjson.loads(self.content)
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise requests.exceptions.HTTPError(f"HTTP {self.status_code}")
+
+
+class FakeSession:
+    """Serve canned responses by URL and record every request made."""
+
+    def __init__(self, responses=None, graphql=None):
+        self.responses = responses or {}
+        self.graphql = graphql
+        self.requests = []
+
+    def get(self, url, params=None, timeout=None, headers=None, stream=False):
+        self.requests.append(("GET", url, headers))
+        response = self.responses.get(url)
+        if response is None:
+            raise requests.exceptions.ConnectionError(f"No response for {url}")
+        return response(headers) if callable(response) else response
+
+    def post(self, url, json=None, timeout=None):
+        self.requests.append(("POST", url, json))
+        if self.graphql is None:
+            raise requests.exceptions.ConnectionError("GraphQL unavailable")
+        return self.graphql
+
+
+@pytest.fixture
+def session(monkeypatch):
+    """Install a fake HTTP session with a GitHub token configured."""
+    fake = FakeSession()
+    monkeypatch.setattr(utils, "SESSION", fake)
+    monkeypatch.setattr(utils, "GITHUB_TOKEN", "token")
+    return fake
+
+
+def _graphql_entry(name, oid, text=None, truncated=False):
+    """Build a directory entry as returned by the GraphQL tree query."""
+    return {"name": name, "type": "blob", "oid": oid, "object": {"text": text, "isTruncated": truncated}}
+
+
+class TestFetchDirectoryJson:
+    """Tests for the single-query GraphQL directory fetch."""
+
+    def test_truncated_blobs_are_fetched_raw(self, session):
+        """Test that files GraphQL truncates are read from the raw URL instead of dropped."""
+        entries = [
+            _graphql_entry("big.json", "sha-big", truncated=True),
+            _graphql_entry("small.json", "sha-small", text='{"id": "small"}'),
+        ]
+        session.graphql = FakeResponse(json_data={"data": {"repository": {"object": {"entries": entries}}}})
+        raw_url = utils.get_raw_github_url(OWNER, REPO, "data/big.json")
+        session.responses[raw_url] = FakeResponse(content=b'{"id": "big"}')
+
+        files = utils.fetch_directory_json(OWNER, REPO, PATH)
+
+        assert files == {
+            "data/big.json": {"sha": "sha-big", "data": {"id": "big"}},
+            "data/small.json": {"sha": "sha-small", "data": {"id": "small"}},
+        }
+        assert session.requests[0][2]["variables"]["expression"] == f"{utils.GITHUB_BRANCH}:data"
+
+
+def _tarball(files):
+    """Build a branch tarball holding the given {repository path: bytes} files."""
+    buffer = io.BytesIO()
+    with tarfile.open(fileobj=buffer, mode="w:gz") as archive:
+        for file_path, content in files.items():
+            info = tarfile.TarInfo(f"{REPO}-{utils.GITHUB_BRANCH}/{file_path}")
+            info.size = len(content)
+            archive.addfile(info, io.BytesIO(content))
+    return buffer.getvalue()
+
+
+def _listing(*entries):
+    """Build a contents listing from (name, sha) pairs."""
+    return FakeResponse(json_data=[{"name": name, "path": f"{PATH}/{name}", "sha": sha} for name, sha in entries])
+
+
+def _raw_url(name):
+    """Raw file URL of a file in the test directory."""
+    return utils.get_raw_github_url(OWNER, REPO, f"{PATH}/{name}")
+
+
+class TestFetchGithubJsonFiles:
+    """Tests for the per-file cache kept by fetch_github_json_files."""
+
+    @pytest.fixture
+    def cache_file(self, tmp_path):
+        """Per-file cache location for one test."""
+        return tmp_path / "files.json"
+
+    def test_first_run_falls_back_to_tarball(self, session, cache_file):
+        """Test that a failed GraphQL query falls back to the branch tarball and seeds the cache."""
+        tarball_url = f"https://codeload.github.com/{OWNER}/{REPO}/tar.gz/refs/heads/{utils.GITHUB_BRANCH}"
+        content = b'{"id": "a"}'
+        session.responses[tarball_url] = FakeResponse(content=_tarball({f"{PATH}/a.json": content}))
+
+        assert utils.fetch_github_json_files(OWNER, REPO, PATH, cache_file) == [{"id": "a"}]
+        assert session.requests[0][0] == "POST"
+        assert utils.load_json(cache_file) == {
+            f"{PATH}/a.json": {"sha": utils.git_blob_sha(content), "data": {"id": "a"}}
+        }
+
+    def test_unchanged_sha_reuses_cached_entry(self, session, cache_file):
+        """Test that a file whose blob SHA matches the cache is not downloaded."""
+        utils.save_json({f"{PATH}/a.json": {"sha": "sha-a", "etag": "e", "data": {"id": "a"}}}, cache_file)
+        session.responses[LISTING_URL] = _listing(("a.json", "sha-a"))
+
+        assert utils.fetch_github_json_files(OWNER, REPO, PATH, cache_file) == [{"id": "a"}]
+        assert [url for _, url, _ in session.requests] == [LISTING_URL]
+
+    def test_not_modified_keeps_cached_data_with_new_sha(self, session, cache_file):
+        """Test that a 304 revalidation keeps the cached data and records the listed SHA."""
+        utils.save_json({f"{PATH}/a.json": {"sha": "old", "etag": "etag-a", "data": {"id": "a"}}}, cache_file)
+        session.responses[LISTING_URL] = _listing(("a.json", "new"))
+        session.responses[_raw_url("a.json")] = lambda headers: FakeResponse(
+            status_code=304 if headers == {"If-None-Match": "etag-a"} else 200, content=b'{"id": "changed"}'
+        )
+
+        assert utils.fetch_github_json_files(OWNER, REPO, PATH, cache_file) == [{"id": "a"}]
+        assert utils.load_json(cache_file) == {f"{PATH}/a.json": {"sha": "new", "etag": "etag-a", "data": {"id": "a"}}}
+
+    def test_changed_file_is_downloaded(self, session, cache_file):
+        """Test that a modified file replaces its cache entry."""
+        utils.save_json({f"{PATH}/a.json": {"sha": "old", "etag": "etag-a", "data": {"id": "a"}}}, cache_file)
+        session.responses[LISTING_URL] = _listing(("a.json", "new"))
+        session.responses[_raw_url("a.json")] = FakeResponse(content=b'{"id": "b"}', headers={"ETag": "etag-b"})
+
+        assert utils.fetch_github_json_files(OWNER, REPO, PATH, cache_file) == [{"id": "b"}]
+        assert utils.load_json(cache_file)[f"{PATH}/a.json"] == {"sha": "new", "etag": "etag-b", "data": {"id": "b"}}
+
+    def test_files_removed_upstream_are_dropped(self, session, cache_file):
+        """Test that cache entries missing from the listing are not carried over."""
+        utils.save_json(
+            {
+                f"{PATH}/a.json": {"sha": "sha-a", "etag": None, "data": {"id": "a"}},
+                f"{PATH}/gone.json": {"sha": "sha-gone", "etag": None, "data": {"id": "gone"}},
+            },
+            cache_file,
+        )
+        session.responses[LISTING_URL] = _listing(("a.json", "sha-a"))
+
+        assert utils.fetch_github_json_files(OWNER, REPO, PATH, cache_file) == [{"id": "a"}]
+        assert list(utils.load_json(cache_file)) == [f"{PATH}/a.json"]
+
+
+class TestEntityCaches:
+    """Tests for the validated entity caches."""
+
+    @pytest.fixture(autouse=True)
+    def cache_dir(self, tmp_path, monkeypatch):
+        """Redirect the entity caches to a temporary directory."""
+        monkeypatch.setattr(fetch_tools, "CACHE_DIR", tmp_path)
+        monkeypatch.setattr(fetch_dimensions, "CACHE_DIR", tmp_path)
+        return tmp_path
+
+    def test_tools_cache_round_trip(self):
+        """Test that the columnar tools cache restores the saved tools, metadata included."""
+        tools = [
+            Tool(
+                id="reuse",
+                name="REUSE",
+                ring="adopt",
+                url="https://reuse.software",
+                related_indicators=["a"],
+                metadata={"license": "MIT"},
+            )
+        ]
+        fetch_tools.save_tools_cache(tools)
+        assert fetch_tools.load_tools_cache() == tools
+
+    def test_tools_cache_version_mismatch_revalidates_items(self, cache_dir):
+        """Test that an older tools cache is validated again instead of trusted."""
+        utils.save_json({"version": 1, "items": [{"id": "reuse", "name": "REUSE"}]}, cache_dir / "tools.json")
+        assert fetch_tools.load_tools_cache() == [Tool(id="reuse", name="REUSE")]
+
+        utils.save_json({"version": 1, "items": [{"name": "missing id"}]}, cache_dir / "tools.json")
+        assert fetch_tools.load_tools_cache() is None
+
+    def test_dimensions_cache_version_mismatch_is_ignored(self, cache_dir):
+        """Test that a dimensions cache written by older code is not used."""
+        fetch_dimensions.save_dimensions_cache([Dimension(id="legal", name="Legal")])
+        assert [dimension.id for dimension in fetch_dimensions.load_dimensions_cache()] == ["legal"]
+
+        utils.save_json({"version": 0, "items": [{"id": "legal", "name": "Legal"}]}, cache_dir / "dimensions.json")
+        assert fetch_dimensions.load_dimensions_cache() is None
+
+
+class TestMemoizedFetch:
+    """Tests for the per-process memo behind fetch_and_validate_*."""
+
+    def test_cached_result_is_reused(self):
+        """Test that later cached calls reuse the first load and return new lists."""
+        loads = []
+        load = utils.memoized_fetch(lambda: loads.append(1) or ["a"], lambda: ["fetched"], "items")
+
+        first, second = load(), load()
+        assert first == second == ["a"]
+        assert first is not second
+        assert len(loads) == 1
+
+    def test_empty_result_is_not_kept(self):
+        """Test that a failed load is retried on the next call."""
+        results = [[], ["a"]]
+        load = utils.memoized_fetch(lambda: None, lambda: results.pop(0), "items")
+
+        assert load() == []
+        assert load() == ["a"]
+
+    def test_uncached_call_fetches_and_drops_memo(self):
+        """Test that use_cache=False always fetches and invalidates the memo."""
+        cache = ["cached-1"]
+        load = utils.memoized_fetch(lambda: list(cache), lambda: ["fetched"], "items")
+
+        assert load() == ["cached-1"]
+        assert load(use_cache=False) == ["fetched"]
+        cache[0] = "cached-2"
+        assert load() == ["cached-2"]
+
+    def test_public_fetchers_expose_cache_clear(self):
+        """Test that each fetch_and_validate_* clears the memo of its own loader."""
+        from scripts import fetch_dimensions, fetch_indicators, fetch_tools
+
+        assert fetch_tools.fetch_and_validate_tools.cache_clear == fetch_tools._get_tools.cache_clear
+        assert (
+            fetch_indicators.fetch_and_validate_indicators.cache_clear == fetch_indicators._get_indicators.cache_clear
+        )
+        assert (
+            fetch_dimensions.fetch_and_validate_dimensions.cache_clear == fetch_dimensions._get_dimensions.cache_clear
+        )
+
+
+def test_drop_duplicate_ids_keeps_first():
+    """Test that only the first record for each id is kept."""
+    records = [{"id": "a", "n": 1}, {"id": "b", "n": 2}, {"id": "a", "n": 3}]
+    assert utils.drop_duplicate_ids(records, "item") == [{"id": "a", "n": 1}, {"id": "b", "n": 2}]